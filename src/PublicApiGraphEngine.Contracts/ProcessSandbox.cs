@@ -25,6 +25,12 @@ public static class ProcessSandbox
     /// <summary>Marker appended to output when truncation occurs.</summary>
     internal const string TruncationMarker = "[OUTPUT TRUNCATED - exceeded ";
 
+    /// <summary>
+    /// Encoding for stdin and stdout. Engines exchange JSON as UTF-8 bytes, so the
+    /// platform default (e.g. a Windows ANSI code page) would garble non-ASCII text.
+    /// </summary>
+    private static readonly UTF8Encoding StreamEncoding = new(encoderShouldEmitUTF8Identifier: false);
+
     /// <summary>
     /// Returns true if the given output was truncated by <see cref="ReadStreamWithLimitAsync"/>.
     /// </summary>
@@ -92,6 +98,8 @@ public static class ProcessSandbox
             RedirectStandardOutput = true,
             RedirectStandardError = true,
             RedirectStandardInput = true,
+            StandardOutputEncoding = StreamEncoding,
+            StandardInputEncoding = StreamEncoding,
             UseShellExecute = false,
             CreateNoWindow = true
         };
@@ -290,6 +298,8 @@ public static class ProcessSandbox
             RedirectStandardOutput = true,
             RedirectStandardError = true,
             RedirectStandardInput = true,
+            StandardOutputEncoding = StreamEncoding,
+            StandardInputEncoding = StreamEncoding,
             UseShellExecute = false,
             CreateNoWindow = true,
         };
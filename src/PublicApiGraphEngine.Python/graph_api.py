@@ -6,13 +6,19 @@ Outputs JSON with classes, methods, functions, and their signatures.
 
 import ast
 import collections
+import concurrent.futures
+import functools
 import importlib
 import inspect
+import io
 import json
+import keyword
+import multiprocessing
 import sys
 import os
 import re
 import types
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 import typing
@@ -28,6 +34,13 @@ except ImportError:
     except ImportError:
         _HAS_TOML = False
 
+# Try to import orjson for faster JSON I/O (optional; falls back to json)
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 # =============================================================================
 # Builtin Type Detection
@@ -81,10 +94,14 @@ import sys as _sys
 PYTHON_STDLIB_PACKAGES: frozenset[str] = _sys.stdlib_module_names
 
 
+@functools.lru_cache(maxsize=4096)
 def is_builtin_type(type_name: str) -> bool:
     """Check if a type name is a Python builtin (always available without imports)."""
+    # Fast path: most callers pass bare identifiers such as "str" or "List"
+    if type_name in PYTHON_BUILTINS:
+        return True
     # Strip generic parameters (e.g., List[str] -> List)
-    base_type = type_name.split("[")[0].strip()
+    base_type = type_name.partition("[")[0].strip()
     # Handle qualified names (e.g., typing.List -> List)
     if "." in base_type:
         # Qualified stdlib names (e.g., os.PathLike, json.JSONDecoder) are NOT builtins —
@@ -93,6 +110,7 @@ def is_builtin_type(type_name: str) -> bool:
     return base_type in PYTHON_BUILTINS
 
 
+@functools.lru_cache(maxsize=1024)
 def is_stdlib_package(package_name: str) -> bool:
     """Check if a package is part of Python stdlib."""
     # Handle subpackages (e.g., collections.abc -> collections)
@@ -100,6 +118,199 @@ def is_stdlib_package(package_name: str) -> bool:
     return root_pkg in PYTHON_STDLIB_PACKAGES
 
 
+# =============================================================================
+# Source Parsing
+# =============================================================================
+
+def _parse_file(path: Path) -> ast.Module | None:
+    """
+    Parse a Python source file, or return None if it is not valid Python.
+
+    Bytes are handed straight to ast.parse, which honours PEP 263 encoding
+    declarations itself. ValueError covers source containing NUL bytes.
+    """
+    try:
+        return ast.parse(path.read_bytes())
+    except (SyntaxError, UnicodeDecodeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_init_file(init_path: Path) -> ast.Module | None:
+    """
+    Parse an __init__.py consulted by several entry-point passes.
+
+    The main __init__.py is read by those passes and again when its module
+    is extracted; only these few files are read more than once per run, so
+    the cache is kept small and other module trees are not retained.
+    """
+    return _parse_file(init_path)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_package_file(file_path: Path) -> ast.Module | None:
+    """
+    Parse an installed package file that may define classes.
+
+    Files without the class keyword cannot define one and are skipped
+    unparsed. The file holding a class just found by _PackageClassIndex is
+    among the most recent parses, so extract_type_from_package gets its
+    tree from this small cache instead of parsing it again.
+    """
+    try:
+        source = file_path.read_bytes()
+    except OSError:
+        return None
+    if b"class" not in source:
+        return None
+    try:
+        return ast.parse(source)
+    except (SyntaxError, UnicodeDecodeError, ValueError):
+        return None
+
+
+# =============================================================================
+# Source File Discovery
+# =============================================================================
+
+# Directories that never contain public package sources: tests, caches,
+# virtual environments, and build artifacts.
+_SKIP_DIR_NAMES = frozenset({
+    '__pycache__',
+    'venv', '.venv',
+    'tests',
+    '.tox', '.nox',
+    'site-packages',
+    'build', 'dist',
+    '.eggs',
+    'node_modules',
+})
+_SKIP_DIR_SUFFIXES = ('.egg-info',)
+_TEST_FILE_PREFIXES = ('test_',)
+_TEST_FILE_SUFFIXES = ('_test.py',)
+
+# Path fragments that disqualify an __init__.py as the package's main init
+# when falling back to a tree search in find_main_init_file.
+_INIT_FALLBACK_SKIP = ('test', 'venv', '.venv', '__pycache__', 'site-packages')
+
+
+def _push_source_dir(stack: list[tuple[str, bool]], entry: os.DirEntry, exempt: bool) -> None:
+    """Queue a subdirectory for the source walk unless it is skipped by name."""
+    name = entry.name
+    if exempt or name == 'TestFixtures':
+        stack.append((entry.path, True))
+    elif not (
+        name in _SKIP_DIR_NAMES
+        or name.endswith(_SKIP_DIR_SUFFIXES)
+        or name.startswith(_TEST_FILE_PREFIXES)
+    ):
+        stack.append((entry.path, False))
+
+
+def _iter_py_files(root: Path) -> Iterator[Path]:
+    """
+    Yield public .py source files under root, pruning skipped directories.
+
+    Directories are filtered by name before descending, so virtualenvs and
+    build trees are never listed. Test modules and private modules (except
+    __init__.py) are skipped. Anything under a TestFixtures directory is
+    exempt from the test/skip filters (used for testing engines themselves).
+    """
+    stack: list[tuple[str, bool]] = [(str(root), 'TestFixtures' in str(root))]
+    while stack:
+        dir_path, exempt = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                _push_source_dir(stack, entry, exempt)
+            elif name.endswith('.py') and entry.is_file():
+                if name.startswith('_') and name != '__init__.py':
+                    continue
+                if not exempt and (name.startswith(_TEST_FILE_PREFIXES) or name.endswith(_TEST_FILE_SUFFIXES)):
+                    continue
+                yield Path(entry.path)
+
+
+def _iter_outer_init_files(root: Path) -> Iterator[Path]:
+    """
+    Yield the outermost __init__.py on each branch of the source walk.
+
+    Same traversal and order as _iter_py_files, but stops descending at a
+    directory holding __init__.py: a nested package's __init__.py always
+    has a longer path than its parent's (and shares any skipped path
+    fragment), so it can never win a shortest-path search.
+    """
+    stack: list[tuple[str, bool]] = [(str(root), 'TestFixtures' in str(root))]
+    while stack:
+        dir_path, exempt = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        init = next((e for e in entries if e.name == '__init__.py' and e.is_file()), None)
+        if init is not None:
+            yield Path(init.path)
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _push_source_dir(stack, entry, exempt)
+
+
+# =============================================================================
+# Parallel Execution
+# =============================================================================
+
+# Below this many files, worker startup costs more than it saves.
+_PARALLEL_MIN_FILES = 64
+_PARALLEL_CHUNK_SIZE = 16
+_PARALLEL_MAX_WORKERS = 32
+
+
+def _parallel_map(
+    fn: typing.Callable[[Any], Any],
+    items: list[Any],
+    initializer: typing.Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = ()
+) -> list[Any] | None:
+    """
+    Map fn over items in a process pool, preserving order.
+
+    Returns None when parallelism is not worthwhile (too few items or a
+    single CPU) or the pool cannot be started or breaks, in which case the
+    caller runs the serial path. Exceptions raised by fn propagate exactly
+    as they would from the serial path. fn, items, and initargs must be
+    picklable.
+    """
+    cpu_count = os.cpu_count() or 1
+    if len(items) < _PARALLEL_MIN_FILES or cpu_count < 2:
+        return None
+
+    max_workers = min(cpu_count, _PARALLEL_MAX_WORKERS, -(-len(items) // _PARALLEL_CHUNK_SIZE))
+    try:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, initializer=initializer, initargs=initargs
+        )
+    except (OSError, ImportError):
+        return None
+
+    with executor:
+        try:
+            # map() submits every chunk up front, which is when workers are spawned
+            results = executor.map(fn, items, chunksize=_PARALLEL_CHUNK_SIZE)
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            return None
+        try:
+            return list(results)
+        except concurrent.futures.process.BrokenProcessPool:
+            return None
+
+
 # =============================================================================
 # Type Reference Collection (AST-Based)
 # =============================================================================
@@ -114,50 +325,96 @@ def collect_types_from_annotation(ann: ast.expr | None, refs: set[str]) -> None:
     - Union types: Union[A, B], A | B
     - Optional types: Optional[X]
     """
-    if ann is None:
-        return
+    handler = _ANN_DISPATCH.get(type(ann))
+    if handler is not None:
+        handler(ann, refs)
 
-    if isinstance(ann, ast.Name):
-        name = ann.id
-        if not is_builtin_type(name):
-            refs.add(name)
-
-    elif isinstance(ann, ast.Attribute):
-        full_name = _get_attribute_name(ann)
-        if full_name and not is_builtin_type(full_name):
-            refs.add(full_name)
-
-    elif isinstance(ann, ast.Subscript):
-        collect_types_from_annotation(ann.value, refs)
-        if isinstance(ann.slice, ast.Tuple):
-            for elt in ann.slice.elts:
-                collect_types_from_annotation(elt, refs)
-        else:
-            collect_types_from_annotation(ann.slice, refs)
 
-    elif isinstance(ann, ast.BinOp) and isinstance(ann.op, ast.BitOr):
+def _collect_name(ann: ast.Name, refs: set[str]) -> None:
+    name = ann.id
+    if not is_builtin_type(name):
+        refs.add(name)
+
+
+def _collect_attribute(ann: ast.Attribute, refs: set[str]) -> None:
+    full_name = _get_attribute_name(ann)
+    if full_name and not is_builtin_type(full_name):
+        # Dotted names are built fresh per node; intern so repeats share one object
+        refs.add(sys.intern(full_name))
+
+
+def _collect_subscript(ann: ast.Subscript, refs: set[str]) -> None:
+    collect_types_from_annotation(ann.value, refs)
+    if isinstance(ann.slice, ast.Tuple):
+        for elt in ann.slice.elts:
+            collect_types_from_annotation(elt, refs)
+    else:
+        collect_types_from_annotation(ann.slice, refs)
+
+
+def _collect_binop(ann: ast.BinOp, refs: set[str]) -> None:
+    if isinstance(ann.op, ast.BitOr):
         collect_types_from_annotation(ann.left, refs)
         collect_types_from_annotation(ann.right, refs)
 
-    elif isinstance(ann, ast.Constant):
-        if isinstance(ann.value, str):
-            try:
-                parsed = ast.parse(ann.value, mode='eval')
-                collect_types_from_annotation(parsed.body, refs)
-            except SyntaxError:
-                pass
 
-    elif isinstance(ann, ast.Tuple):
-        for elt in ann.elts:
-            collect_types_from_annotation(elt, refs)
+def _collect_constant(ann: ast.Constant, refs: set[str]) -> None:
+    value = ann.value
+    if not isinstance(value, str) or not value:
+        return
+    # Forward references are overwhelmingly bare names ("MyClass"); handle
+    # those without invoking the parser.
+    if value.isidentifier():
+        if not keyword.iskeyword(value) and not is_builtin_type(value):
+            refs.add(value)
+        return
+    # Only parse strings that look like a structured type expression
+    if '[' in value or '.' in value or '|' in value:
+        refs.update(_forward_ref_types(value))
 
-    elif isinstance(ann, ast.List):
-        for elt in ann.elts:
-            collect_types_from_annotation(elt, refs)
+
+@functools.lru_cache(maxsize=8192)
+def _forward_ref_types(value: str) -> frozenset[str]:
+    """
+    Type names referenced by a structured string annotation.
+
+    Modules using `from __future__ import annotations` repeat the same
+    strings throughout, so each distinct one is parsed only once.
+    """
+    refs: set[str] = set()
+    try:
+        parsed = ast.parse(value, mode='eval')
+        collect_types_from_annotation(parsed.body, refs)
+    except SyntaxError:
+        pass
+    return frozenset(refs)
+
+
+def _collect_elts(ann: ast.Tuple | ast.List, refs: set[str]) -> None:
+    for elt in ann.elts:
+        collect_types_from_annotation(elt, refs)
+
+
+# Exact node type -> handler. Looking up type(ann) in a dict avoids running
+# a chain of isinstance checks for every node of every annotation.
+_ANN_DISPATCH: dict[type, typing.Callable[[Any, set[str]], None]] = {
+    ast.Name: _collect_name,
+    ast.Attribute: _collect_attribute,
+    ast.Subscript: _collect_subscript,
+    ast.BinOp: _collect_binop,
+    ast.Constant: _collect_constant,
+    ast.Tuple: _collect_elts,
+    ast.List: _collect_elts,
+}
 
 
 def _get_attribute_name(node: ast.Attribute) -> str | None:
     """Get the full dotted name from an Attribute node."""
+    # Fast path: two-part names such as typing.List or models.Widget
+    value = node.value
+    if type(value) is ast.Name:
+        return f"{value.id}.{node.attr}"
+
     parts: list[str] = []
     current: ast.expr = node
     while isinstance(current, ast.Attribute):
@@ -169,6 +426,26 @@ def _get_attribute_name(node: ast.Attribute) -> str | None:
     return None
 
 
+# Nodes that can hold statements: statements themselves, except clauses
+# and match cases. Expressions never contain statements.
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _walk_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """
+    Like ast.walk (breadth-first, same relative order), but never descends
+    into expressions, which cannot contain import statements.
+    """
+    todo = collections.deque([tree])
+    while todo:
+        node = todo.popleft()
+        todo.extend(
+            child for child in ast.iter_child_nodes(node)
+            if isinstance(child, _STATEMENT_CONTAINERS)
+        )
+        yield node
+
+
 class TypeReferenceCollector:
     """
     Collects type references during engine run using proper AST traversal.
@@ -178,10 +455,13 @@ class TypeReferenceCollector:
         self.defined_types: set[str] = set()
         self.resolved_packages: dict[str, str] = {}
         self.import_map: dict[str, str] = {}  # simple_name -> module_path
+        # installed package names grouped by first dotted segment, longest first
+        self._installed_by_root: dict[str, list[str]] = {}
+        self._installed_source: set[str] | None = None
 
     def add_defined_type(self, name: str) -> None:
         """Register a locally defined type."""
-        self.defined_types.add(name.split("[")[0])
+        self.defined_types.add(sys.intern(name.partition("[")[0]))
 
     def collect_from_annotation(self, ann: ast.expr | None) -> None:
         """Collect type references from an annotation AST node."""
@@ -192,26 +472,34 @@ class TypeReferenceCollector:
         Collect import statements from an AST module, including those inside
         TYPE_CHECKING blocks. Builds a mapping from simple names to their
         source module paths (e.g., "HTTPResponse" -> "http.client").
+
+        Statements are visited in ast.walk (breadth-first) order and later
+        visits win, so an import nested in an if/try block (such as
+        TYPE_CHECKING) overrides a same-named top-level import.
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom):
+        for node in _walk_statements(tree):
+            t = type(node)
+            if t is ast.ImportFrom:
                 if not node.module or node.module == "__future__":
                     continue
+                module = sys.intern(node.module)
                 for alias in (node.names or []):
                     name = alias.asname or alias.name
                     if name != "*" and not is_builtin_type(name):
-                        self.import_map[name] = node.module
-            elif isinstance(node, ast.Import):
+                        self.import_map[sys.intern(name)] = module
+            elif t is ast.Import:
                 for alias in node.names:
                     name = alias.asname or alias.name
                     if not is_builtin_type(name):
-                        self.import_map[name] = alias.name
+                        self.import_map[sys.intern(name)] = sys.intern(alias.name)
 
     def get_external_refs(self) -> set[str]:
         """Get type references that are not locally defined and not builtins."""
+        # refs only ever hold bare or dotted names (subscripts are collected
+        # by their parts), so they compare directly against defined_types.
         return {
-            name for name in self.refs
-            if name.split("[")[0] not in self.defined_types and not is_builtin_type(name)
+            name for name in self.refs - self.defined_types
+            if not is_builtin_type(name)
         }
 
     def resolve_package(self, type_name: str, installed_packages: set[str]) -> str | None:
@@ -223,31 +511,46 @@ class TypeReferenceCollector:
             return self.resolved_packages[type_name]
 
         # Check import map — deterministic resolution from source imports
-        base_name = type_name.split("[")[0]
+        base_name = type_name.partition("[")[0]
         if base_name in self.import_map:
             module_path = self.import_map[base_name]
             root_pkg = module_path.split(".")[0]
             if root_pkg in installed_packages:
+                root_pkg = sys.intern(root_pkg)
                 self.resolved_packages[type_name] = root_pkg
                 return root_pkg
 
-        # Fall back to dotted-name prefix matching
+        # Fall back to dotted-name prefix matching (longest installed prefix wins)
         if "." in type_name:
-            parts = type_name.split(".")
-            for i in range(len(parts) - 1, 0, -1):
-                pkg = ".".join(parts[:i])
-                if pkg in installed_packages:
+            if self._installed_source is not installed_packages:
+                self._index_installed_packages(installed_packages)
+            root = type_name.partition(".")[0]
+            for pkg in self._installed_by_root.get(root, ()):
+                if type_name.startswith(pkg) and type_name[len(pkg):len(pkg) + 1] == ".":
+                    pkg = sys.intern(pkg)
                     self.resolved_packages[type_name] = pkg
                     return pkg
 
         return None
 
+    def _index_installed_packages(self, installed_packages: set[str]) -> None:
+        """Group installed package names by root segment for prefix matching."""
+        by_root: dict[str, list[str]] = {}
+        for pkg in installed_packages:
+            by_root.setdefault(pkg.partition(".")[0], []).append(pkg)
+        for candidates in by_root.values():
+            candidates.sort(key=len, reverse=True)
+        self._installed_by_root = by_root
+        self._installed_source = installed_packages
+
     def clear(self) -> None:
         """Reset the collector for a new engine run."""
         self.refs.clear()
         self.defined_types.clear()
         self.resolved_packages.clear()
         self.import_map.clear()
+        self._installed_by_root = {}
+        self._installed_source = None
 
 
 # Global collector instance
@@ -292,21 +595,33 @@ def find_main_init_file(root_path: Path, package_name: str) -> Path | None:
     """Find the main package __init__.py file."""
     pkg_dir_name = package_name.replace('-', '_').replace('.', '/')
 
-    search_paths = [
-        root_path / pkg_dir_name / "__init__.py",
-        root_path / "src" / pkg_dir_name / "__init__.py",
-        root_path / package_name / "__init__.py",
-        root_path / "src" / package_name / "__init__.py",
-    ]
-
-    for path in search_paths:
-        if path.exists():
-            return path
-
-    # Fallback: find first __init__.py in non-test directory
-    for init in sorted(root_path.rglob("__init__.py"), key=lambda p: len(str(p))):
+    # Candidates are <base>/<pkg>/__init__.py for base in (root, root/src).
+    # List each base directory once and only stat candidates whose top-level
+    # directory is actually present. Names are compared case-insensitively so
+    # case-insensitive filesystems still resolve via the final exists() check.
+    bases = (root_path, root_path / "src")
+    base_entries: dict[Path, set[str]] = {}
+    for rel in dict.fromkeys((pkg_dir_name, package_name)):
+        top = rel.split('/')[0].lower()
+        for base in bases:
+            entries = base_entries.get(base)
+            if entries is None:
+                try:
+                    with os.scandir(base) as it:
+                        entries = {entry.name.lower() for entry in it}
+                except OSError:
+                    entries = set()
+                base_entries[base] = entries
+            if top in entries:
+                path = base / rel / "__init__.py"
+                if path.exists():
+                    return path
+
+    # Fallback: find first __init__.py in non-test directory (shortest path,
+    # ties broken by name so sibling packages resolve the same on every OS)
+    for init in sorted(_iter_outer_init_files(root_path), key=lambda p: (len(str(p)), str(p))):
         path_str = str(init).lower()
-        if not any(x in path_str for x in ['test', 'venv', '.venv', '__pycache__', 'site-packages']):
+        if not any(x in path_str for x in _INIT_FALLBACK_SKIP):
             return init
 
     return None
@@ -314,10 +629,8 @@ def find_main_init_file(root_path: Path, package_name: str) -> Path | None:
 
 def extract_all_from_init(init_path: Path) -> list[str]:
     """Extract __all__ list from __init__.py."""
-    try:
-        code = init_path.read_text(encoding='utf-8')
-        tree = ast.parse(code)
-    except (SyntaxError, UnicodeDecodeError):
+    tree = _parse_init_file(init_path)
+    if tree is None:
         return []
 
     for node in ast.iter_child_nodes(tree):
@@ -344,10 +657,8 @@ def extract_reexports_from_init(init_path: Path) -> tuple[set[str], dict[str, st
     Returns:
         Tuple of (local_symbols, external_reexports)
     """
-    try:
-        code = init_path.read_text(encoding='utf-8')
-        tree = ast.parse(code)
-    except (SyntaxError, UnicodeDecodeError):
+    tree = _parse_init_file(init_path)
+    if tree is None:
         return set(), {}
 
     local_symbols: set[str] = set()
@@ -384,20 +695,118 @@ def extract_reexports_from_init(init_path: Path) -> tuple[set[str], dict[str, st
 
 def get_docstring(node: ast.AST) -> str | None:
     """Extract first line of docstring."""
-    doc = ast.get_docstring(node)
-    if not doc:
+    body = getattr(node, 'body', None)
+    if not body or type(body[0]) is not ast.Expr:
         return None
-    first_line = doc.split('\n')[0].strip()
+    value = body[0].value
+    if type(value) is not ast.Constant or type(value.value) is not str:
+        return None
+    text = value.value
+    # Read the summary line straight from the raw string: cleaning only
+    # drops a leading blank line and expands tabs, so the full
+    # inspect.cleandoc pass is needed just for rarer layouts.
+    nl = text.find('\n')
+    first_line = text if nl < 0 else text[:nl]
+    if not first_line.strip() and nl >= 0:
+        end = text.find('\n', nl + 1)
+        first_line = text[nl + 1:] if end < 0 else text[nl + 1:end]
+    if first_line.strip():
+        first_line = first_line.expandtabs().strip()
+    else:
+        doc = ast.get_docstring(node)
+        if not doc:
+            return None
+        first_line = doc.split('\n')[0].strip()
     return first_line[:150] + '...' if len(first_line) > 150 else first_line
 
+def _unparse_simple(node: ast.expr) -> str | None:
+    """
+    Render the common annotation shapes (names, dotted names, subscripts,
+    X | Y unions, None, ...) the same way ast.unparse does, without its
+    visitor machinery. Returns None for anything else.
+    """
+    t = type(node)
+    if t is ast.Name:
+        return node.id
+    if t is ast.Attribute:
+        if type(node.value) is not ast.Name and type(node.value) is not ast.Attribute:
+            return None
+        value = _unparse_simple(node.value)
+        return None if value is None else f"{value}.{node.attr}"
+    if t is ast.Subscript:
+        if type(node.value) is not ast.Name and type(node.value) is not ast.Attribute:
+            return None
+        value = _unparse_simple(node.value)
+        sl = node.slice
+        if type(sl) is ast.Tuple:
+            if len(sl.elts) < 2:
+                return None
+            inner = _unparse_simple_seq(sl.elts)
+        else:
+            inner = _unparse_simple(sl)
+        if value is None or inner is None:
+            return None
+        return f"{value}[{inner}]"
+    if t is ast.BinOp:
+        # Left-nested X | Y | Z only; right-nested unions need parentheses
+        if type(node.op) is not ast.BitOr or type(node.right) is ast.BinOp:
+            return None
+        left = _unparse_simple(node.left)
+        right = _unparse_simple(node.right)
+        if left is None or right is None:
+            return None
+        return f"{left} | {right}"
+    if t is ast.List:
+        inner = _unparse_simple_seq(node.elts)
+        return None if inner is None else f"[{inner}]"
+    if t is ast.Constant:
+        if node.value is None:
+            return "None"
+        if node.value is Ellipsis:
+            return "..."
+    return None
+
+def _unparse_simple_seq(elts: list[ast.expr]) -> str | None:
+    """Render a comma-separated element list via _unparse_simple."""
+    parts = []
+    for elt in elts:
+        part = _unparse_simple(elt)
+        if part is None:
+            return None
+        parts.append(part)
+    return ", ".join(parts)
+
+def _unparse_annotation(ann: ast.expr) -> str:
+    """Convert annotation AST to string, skipping ast.unparse when possible."""
+    # Bare names dominate real annotations
+    if type(ann) is ast.Name:
+        return ann.id
+    text = _unparse_simple(ann)
+    return ast.unparse(ann) if text is None else text
+
 def format_annotation(ann: ast.expr | None) -> str | None:
     """Convert annotation AST to string."""
     if ann is None:
         return None
-    return ast.unparse(ann)
+    return _unparse_annotation(ann)
+
+def _format_and_collect(ann: ast.expr) -> str:
+    """Convert annotation AST to string and collect the types it references."""
+    collect_types_from_annotation(ann, _type_collector.refs)
+    return _unparse_annotation(ann)
+
+def extract_parameters(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+    formatted: dict[ast.expr, str] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Extract structured parameter information.
 
-def extract_parameters(node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[dict[str, Any]]:
-    """Extract structured parameter information."""
+    formatted maps annotation nodes to text the caller already rendered,
+    so those annotations are not unparsed a second time.
+    """
+    if formatted is None:
+        formatted = {}
     args_obj = node.args
     params: list[dict[str, Any]] = []
 
@@ -411,7 +820,7 @@ def extract_parameters(node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[dic
             "kind": "positional",
         }
         if arg.annotation:
-            param["type"] = ast.unparse(arg.annotation)
+            param["type"] = formatted.get(arg.annotation) or format_annotation(arg.annotation)
         if i >= default_start and positional_defaults:
             default_expr = positional_defaults[i - default_start]
             if default_expr is not None:
@@ -425,7 +834,7 @@ def extract_parameters(node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[dic
             "kind": "var_positional",
         }
         if vararg.annotation:
-            param["type"] = ast.unparse(vararg.annotation)
+            param["type"] = formatted.get(vararg.annotation) or format_annotation(vararg.annotation)
         params.append(param)
 
     for kw_arg, kw_default in zip(args_obj.kwonlyargs, args_obj.kw_defaults):
@@ -434,7 +843,7 @@ def extract_parameters(node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[dic
             "kind": "keyword_only",
         }
         if kw_arg.annotation:
-            param["type"] = ast.unparse(kw_arg.annotation)
+            param["type"] = formatted.get(kw_arg.annotation) or format_annotation(kw_arg.annotation)
         if kw_default is not None:
             param["default"] = ast.unparse(kw_default)
         params.append(param)
@@ -446,7 +855,7 @@ def extract_parameters(node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[dic
             "kind": "var_keyword",
         }
         if kwarg.annotation:
-            param["type"] = ast.unparse(kwarg.annotation)
+            param["type"] = formatted.get(kwarg.annotation) or format_annotation(kwarg.annotation)
         params.append(param)
 
     return params
@@ -469,6 +878,15 @@ def get_deprecation_info(node: ast.AST) -> tuple[bool, str | None]:
                 return True, None
     return False, None
 
+def _is_overload_decorated(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    """Check whether a function is decorated with @overload / @typing.overload."""
+    for dec in func_node.decorator_list:
+        if isinstance(dec, ast.Name) and dec.id == "overload":
+            return True
+        if isinstance(dec, ast.Attribute) and dec.attr == "overload":
+            return True
+    return False
+
 def extract_function(
     node: ast.FunctionDef | ast.AsyncFunctionDef,
     entry_point_symbols: set[str] | None = None,
@@ -476,28 +894,30 @@ def extract_function(
 ) -> dict[str, Any]:
     """Extract function/method info and collect type references."""
     args = []
+    # Rendered annotation text by node, reused by extract_parameters
+    formatted: dict[ast.expr, str] = {}
     for arg in node.args.args:
-        arg_str = arg.arg
         if arg.annotation:
-            arg_str += f": {ast.unparse(arg.annotation)}"
-            _type_collector.collect_from_annotation(arg.annotation)
-        args.append(arg_str)
+            text = formatted[arg.annotation] = _format_and_collect(arg.annotation)
+            args.append(f"{arg.arg}: {text}")
+        else:
+            args.append(arg.arg)
 
     # Handle *args, **kwargs
     if node.args.vararg:
         va = node.args.vararg
-        va_str = f"*{va.arg}"
         if va.annotation:
-            va_str += f": {ast.unparse(va.annotation)}"
-            _type_collector.collect_from_annotation(va.annotation)
-        args.append(va_str)
+            text = formatted[va.annotation] = _format_and_collect(va.annotation)
+            args.append(f"*{va.arg}: {text}")
+        else:
+            args.append(f"*{va.arg}")
     if node.args.kwarg:
         kw = node.args.kwarg
-        kw_str = f"**{kw.arg}"
         if kw.annotation:
-            kw_str += f": {ast.unparse(kw.annotation)}"
-            _type_collector.collect_from_annotation(kw.annotation)
-        args.append(kw_str)
+            text = formatted[kw.annotation] = _format_and_collect(kw.annotation)
+            args.append(f"**{kw.arg}: {text}")
+        else:
+            args.append(f"**{kw.arg}")
 
     sig = ", ".join(args)
 
@@ -506,14 +926,12 @@ def extract_function(
         "sig": sig,
     }
 
-    params = extract_parameters(node)
+    params = extract_parameters(node, formatted)
     if params:
         result["params"] = params
 
-    ret = format_annotation(node.returns)
-    if ret:
-        result["ret"] = ret
-        _type_collector.collect_from_annotation(node.returns)
+    if node.returns:
+        result["ret"] = _format_and_collect(node.returns)
 
     doc = get_docstring(node)
     if doc:
@@ -539,12 +957,8 @@ def extract_function(
     # Check decorators
     for dec in node.decorator_list:
         if isinstance(dec, ast.Name):
-            if dec.id == "classmethod":
-                result["classmethod"] = True
-            elif dec.id == "staticmethod":
-                result["staticmethod"] = True
-            elif dec.id == "property":
-                result["property"] = True
+            if dec.id in {"classmethod", "staticmethod", "property"}:
+                result[dec.id] = True
 
     return result
 
@@ -556,9 +970,10 @@ def extract_class(
     """Extract class info and collect type references."""
     bases = []
     for b in node.bases:
-        if isinstance(b, (ast.Name, ast.Attribute, ast.Subscript)):
-            bases.append(ast.unparse(b))
-            _type_collector.collect_from_annotation(b)
+        t = type(b)
+        # Plain-name bases (the vast majority) skip ast.unparse entirely
+        if t is ast.Name or t is ast.Attribute or t is ast.Subscript:
+            bases.append(_format_and_collect(b))
 
     result: dict[str, Any] = {
         "name": node.name,
@@ -595,21 +1010,13 @@ def extract_class(
     # the generic implementation signature (which is often just *args/**kwargs).
     overload_map: dict[str, list[dict[str, Any]]] = {}
 
-    def _is_overload_decorated(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-        for dec in func_node.decorator_list:
-            if isinstance(dec, ast.Name) and dec.id == "overload":
-                return True
-            if isinstance(dec, ast.Attribute) and dec.attr == "overload":
-                return True
-        return False
-
     for item in node.body:
-        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            # Skip private (single underscore) but keep dunder methods
-            if item.name.startswith('_') and not item.name.startswith('__'):
-                continue
-            # Skip private dunders (double underscore not ending with double)
-            if item.name.startswith('__') and not item.name.endswith('__'):
+        t = type(item)
+        if t is ast.FunctionDef or t is ast.AsyncFunctionDef:
+            # Skip private and name-mangled methods but keep dunder methods.
+            # A single index check keeps the common public case cheap.
+            name = item.name
+            if name[0] == '_' and not (name.startswith('__') and name.endswith('__')):
                 continue
 
             if _is_overload_decorated(item):
@@ -666,39 +1073,33 @@ def extract_module(
     external_reexports: dict[str, str] | None = None
 ) -> dict[str, Any]:
     """Extract module info."""
-    try:
-        code = file_path.read_text(encoding='utf-8')
-        tree = ast.parse(code)
-    except (SyntaxError, UnicodeDecodeError):
+    if file_path.name == '__init__.py':
+        tree = _parse_init_file(file_path)
+    else:
+        tree = _parse_file(file_path)
+    if tree is None:
         return {}
 
     # Collect imports from this module (including TYPE_CHECKING blocks)
     _type_collector.collect_imports(tree)
 
     # Calculate module name
-    rel_path = file_path.relative_to(root_path)
-    module_name = str(rel_path).replace('/', '.').replace('\\', '.').replace('.py', '')
-    if module_name.endswith('.__init__'):
-        module_name = module_name[:-9]
+    parts = file_path.relative_to(root_path).with_suffix('').parts
+    if len(parts) > 1 and parts[-1] == '__init__':
+        parts = parts[:-1]
+    module_name = '.'.join(parts)
 
     classes = []
     functions = []
     overload_map: dict[str, list[dict[str, Any]]] = {}
 
-    def _is_overload_decorated(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-        for dec in func_node.decorator_list:
-            if isinstance(dec, ast.Name) and dec.id == "overload":
-                return True
-            if isinstance(dec, ast.Attribute) and dec.attr == "overload":
-                return True
-        return False
-
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, ast.ClassDef):
-            if not node.name.startswith('_'):
+    for node in tree.body:
+        t = type(node)
+        if t is ast.ClassDef:
+            if node.name[0] != '_':
                 classes.append(extract_class(node, entry_point_symbols, external_reexports))
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if not node.name.startswith('_'):
+        elif t is ast.FunctionDef or t is ast.AsyncFunctionDef:
+            if node.name[0] != '_':
                 if _is_overload_decorated(node):
                     func_info = extract_function(node, entry_point_symbols, external_reexports)
                     overload_map.setdefault(node.name, []).append(func_info)
@@ -732,6 +1133,12 @@ def extract_module(
 
     return result
 
+# TOML keys start a line, so anchoring skips stray `name = "..."` strings
+# inside dependency tables and lets the search bail early on other lines.
+_PYPROJECT_NAME_RE = re.compile(r'^\s*name\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+# setup(name="...") may share a line with the call, so this one is unanchored.
+_SETUP_NAME_RE = re.compile(r'\bname\s*=\s*["\']([^"\']+)["\']')
+
 def find_package_name(root_path: Path) -> str:
     """Detect package name from pyproject.toml, setup.py, or directory structure."""
     # Check pyproject.toml
@@ -760,7 +1167,7 @@ def find_package_name(root_path: Path) -> str:
         # Regex fallback (less robust but works without TOML dependencies)
         try:
             content = pyproject.read_text(encoding='utf-8')
-            match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
+            match = _PYPROJECT_NAME_RE.search(content)
             if match:
                 return match.group(1)
         except Exception:
@@ -771,53 +1178,99 @@ def find_package_name(root_path: Path) -> str:
     if setup_py.exists():
         try:
             content = setup_py.read_text(encoding='utf-8')
-            match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
+            match = _SETUP_NAME_RE.search(content)
             if match:
                 return match.group(1)
         except Exception:
             pass
 
-    # Find first package with __init__.py
-    for init in sorted(root_path.rglob("__init__.py"), key=lambda p: len(str(p))):
-        if "test" not in str(init).lower() and "_generated" not in str(init):
+    # Find first package with __init__.py (shortest path, ties broken by name)
+    for init in sorted(_iter_outer_init_files(root_path), key=lambda p: (len(str(p)), str(p))):
+        path_str = str(init)
+        if "test" not in path_str.lower() and "_generated" not in path_str:
             return init.parent.name
 
     return root_path.name
 
+def _extract_module_worker(
+    file_path: Path,
+    root_path: Path,
+    entry_point_symbols: set[str],
+    external_reexports: dict[str, str]
+) -> tuple[dict[str, Any], set[str], set[str], dict[str, str]]:
+    """
+    Extract one module in a pool worker with an isolated type collector.
+
+    Returns the module info along with copies of the refs, defined types,
+    and import map it produced, for merging into the parent's collector.
+    """
+    _type_collector.clear()
+    module = extract_module(file_path, root_path, entry_point_symbols, external_reexports)
+    return (
+        module,
+        set(_type_collector.refs),
+        set(_type_collector.defined_types),
+        dict(_type_collector.import_map),
+    )
+
+
+def _extract_modules(
+    py_files: list[Path],
+    root_path: Path,
+    entry_point_symbols: set[str],
+    external_reexports: dict[str, str]
+) -> list[dict[str, Any]]:
+    """
+    Extract modules for all files, in order.
+
+    Large packages are spread across a process pool; each file is parsed and
+    walked independently, so the work is CPU-bound and trivially parallel.
+    Falls back to serial extraction for small packages, single-core hosts,
+    or environments where worker processes cannot be started.
+    """
+    worker = functools.partial(
+        _extract_module_worker,
+        root_path=root_path,
+        entry_point_symbols=entry_point_symbols,
+        external_reexports=external_reexports,
+    )
+    results = _parallel_map(worker, py_files)
+    if results is not None:
+        modules = []
+        # Merge in file order so later imports win, as in serial extraction
+        for module, refs, defined_types, import_map in results:
+            _type_collector.refs.update(refs)
+            _type_collector.defined_types.update(defined_types)
+            _type_collector.import_map.update(import_map)
+            modules.append(module)
+        return modules
+
+    return [
+        extract_module(py_file, root_path, entry_point_symbols, external_reexports)
+        for py_file in py_files
+    ]
+
+
 def extract_package(root_path: Path) -> dict[str, Any]:
     """Extract entire package API."""
     package_name = find_package_name(root_path)
 
-    # Clear the type collector for this engine run
+    # Clear the type collector and parse caches for this engine run
     _type_collector.clear()
+    _parse_init_file.cache_clear()
+    _parse_package_file.cache_clear()
+    _package_class_index.cache_clear()
+    extract_type_from_package.cache_clear()
 
     # Resolve entry point symbols and external re-exports from package configuration
     entry_point_symbols, external_reexports = resolve_entry_point_symbols(root_path, package_name)
 
-    modules = []
-    for py_file in sorted(root_path.rglob("*.py")):
-        # Skip tests, caches, venvs, and build artifacts
-        path_str = str(py_file)
-        # Allow TestFixtures (used for testing engines themselves)
-        if 'TestFixtures' not in path_str and any(skip in path_str for skip in [
-            '__pycache__',
-            'venv', '.venv',
-            'test_', '_test.py', '/tests/', '\\tests\\',
-            '.tox', '.nox',
-            'site-packages',
-            '/build/', '\\build\\',
-            '/dist/', '\\dist\\',
-            '.eggs', '.egg-info',
-            'node_modules'
-        ]):
-            continue
-        # Skip private modules except __init__
-        if py_file.name.startswith('_') and py_file.name != '__init__.py':
-            continue
-
-        module = extract_module(py_file, root_path, entry_point_symbols, external_reexports)
-        if module:
-            modules.append(module)
+    py_files = sorted(_iter_py_files(root_path))
+    modules = [
+        module
+        for module in _extract_modules(py_files, root_path, entry_point_symbols, external_reexports)
+        if module
+    ]
 
     result: dict[str, Any] = {
         "package": package_name,
@@ -854,38 +1307,145 @@ def find_installed_packages(root_path: Path) -> dict[str, Path]:
         if not search_path.exists():
             continue
 
-        site_packages_paths = list(search_path.glob("**/site-packages"))
-        for site_packages in site_packages_paths:
-            if not site_packages.is_dir():
+        for site_packages in _find_site_packages_dirs(str(search_path)):
+            try:
+                with os.scandir(site_packages) as it:
+                    entries = list(it)
+            except OSError:
                 continue
 
-            for item in site_packages.iterdir():
-                if item.is_dir() and not item.name.startswith(('_', '.')):
-                    if (item / "__init__.py").exists() or (item / "__init__.pyi").exists():
-                        pkg_name = item.name
-                        if pkg_name not in packages:
-                            packages[pkg_name] = item
+            for entry in entries:
+                name = entry.name
+                if name.startswith(('_', '.')) or not entry.is_dir():
+                    continue
+                if os.path.exists(os.path.join(entry.path, "__init__.py")) or os.path.exists(os.path.join(entry.path, "__init__.pyi")):
+                    if name not in packages:
+                        packages[name] = Path(entry.path)
 
     return packages
 
 
-def extract_type_from_package(type_name: str, package_path: Path) -> dict[str, Any] | None:
-    """Try to extract a type definition from a package."""
-    for pattern in ["**/*.pyi", "**/*.py"]:
-        for file_path in package_path.glob(pattern):
-            if file_path.name.startswith('_') and file_path.name != '__init__.py' and file_path.name != '__init__.pyi':
+def _find_site_packages_dirs(search_path: str) -> Iterator[str]:
+    """
+    Yield site-packages directories below search_path.
+
+    Walks with os.scandir, reusing the file type information from each
+    directory read, and does not descend into a site-packages directory
+    once found.
+    """
+    stack = [search_path]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                subdirs = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            continue
+        for entry in subdirs:
+            if entry.name == "site-packages":
+                yield entry.path
+        stack.extend(entry.path for entry in reversed(subdirs) if entry.name != "site-packages")
+
+
+def _iter_package_files(package_path: Path) -> Iterator[Path]:
+    """
+    Yield an installed package's public .pyi stubs, then its .py sources.
+
+    Files are collected in a single os.scandir walk (depth-first, parent
+    files before subdirectories) instead of one tree walk per extension.
+    Private modules other than __init__ are skipped.
+    """
+    stubs: list[str] = []
+    sources: list[str] = []
+    stack = [str(package_path)]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: list[str] = []
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name[0] != '.' and name != '__pycache__':
+                    subdirs.append(entry.path)
+            elif name[0] == '_' and name != '__init__.py' and name != '__init__.pyi':
                 continue
+            elif name.endswith('.pyi'):
+                stubs.append(entry.path)
+            elif name.endswith('.py'):
+                sources.append(entry.path)
+        stack.extend(reversed(subdirs))
 
-            try:
-                code = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(code)
-            except (SyntaxError, UnicodeDecodeError):
+    for path in stubs:
+        yield Path(path)
+    for path in sources:
+        yield Path(path)
+
+
+class _PackageClassIndex:
+    """
+    Lazily built index of top-level class names to defining files for one
+    installed package.
+
+    Files are parsed in the same order the package was always searched
+    (stubs first, then sources) and only as far as needed to answer a
+    lookup; later lookups resume where the previous one stopped, so each
+    file is parsed at most once for indexing. Only file paths are retained,
+    not syntax trees (beyond the few recent ones _parse_package_file keeps),
+    to keep memory flat across large environments.
+    """
+
+    def __init__(self, package_path: Path) -> None:
+        self._pending: Iterator[Path] | None = _iter_package_files(package_path)
+        self._locations: dict[str, Path] = {}
+
+    def find(self, type_name: str) -> Path | None:
+        """Return the first file defining type_name at top level, if any."""
+        location = self._locations.get(type_name)
+        if location is not None or self._pending is None:
+            return location
+
+        for file_path in self._pending:
+            tree = _parse_package_file(file_path)
+            if tree is None:
                 continue
+            for node in tree.body:
+                if type(node) is ast.ClassDef:
+                    self._locations.setdefault(node.name, file_path)
+            if type_name in self._locations:
+                return self._locations[type_name]
+
+        self._pending = None
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _package_class_index(package_path: Path) -> _PackageClassIndex:
+    """Get the shared class index for an installed package."""
+    return _PackageClassIndex(package_path)
+
 
-            for node in ast.iter_child_nodes(tree):
-                if isinstance(node, ast.ClassDef) and node.name == type_name:
-                    return extract_class(node)
+@functools.lru_cache(maxsize=None)
+def extract_type_from_package(type_name: str, package_path: Path) -> dict[str, Any] | None:
+    """
+    Try to extract a type definition from a package.
+
+    Cached for the run: refs that share a short name, and the fallback
+    search over all installed packages, ask for the same type repeatedly.
+    """
+    file_path = _package_class_index(package_path).find(type_name)
+    if file_path is None:
+        return None
 
+    tree = _parse_package_file(file_path)
+    if tree is None:
+        return None
+    for node in tree.body:
+        if type(node) is ast.ClassDef and node.name == type_name:
+            return extract_class(node)
     return None
 
 
@@ -895,6 +1455,7 @@ def resolve_transitive_dependencies(api: dict[str, Any], root_path: Path) -> lis
     Uses import map for deterministic resolution, then falls back to
     installed package scanning.
     """
+    # Snapshot: extracting dependency classes below adds to the collector's refs
     external_refs = _type_collector.get_external_refs()
 
     if not external_refs:
@@ -905,26 +1466,40 @@ def resolve_transitive_dependencies(api: dict[str, Any], root_path: Path) -> lis
 
     dependencies: dict[str, dict[str, Any]] = {}
 
+    # (package, class name) pairs already recorded; refs that share a short
+    # name (a.Foo, b.Foo) resolve to the same class and are listed once
+    recorded: set[tuple[str, str]] = set()
+
+    def dependency(pkg: str) -> dict[str, Any]:
+        dep_info = dependencies.get(pkg)
+        if dep_info is None:
+            dep_info = dependencies[pkg] = {"package": pkg, "isStdlib": is_stdlib_package(pkg), "classes": []}
+        return dep_info
+
+    def add_class(pkg: str, type_info: dict[str, Any]) -> None:
+        dep_info = dependency(pkg)
+        key = (pkg, type_info["name"])
+        if key not in recorded:
+            recorded.add(key)
+            dep_info["classes"].append(type_info)
+
     for type_name in external_refs:
         pkg_name = _type_collector.resolve_package(type_name, installed_package_names)
+        short_name = type_name.split(".")[-1]
 
         if pkg_name and pkg_name in installed_packages:
             pkg_path = installed_packages[pkg_name]
-            type_info = extract_type_from_package(type_name.split(".")[-1], pkg_path)
+            type_info = extract_type_from_package(short_name, pkg_path)
             if type_info:
-                if pkg_name not in dependencies:
-                    dependencies[pkg_name] = {"package": pkg_name, "isStdlib": is_stdlib_package(pkg_name), "classes": []}
-                dependencies[pkg_name]["classes"].append(type_info)
+                add_class(pkg_name, type_info)
                 continue
 
         # Fall back to searching all installed packages
         found = False
         for pkg_name_search, pkg_path in installed_packages.items():
-            type_info = extract_type_from_package(type_name.split(".")[-1], pkg_path)
+            type_info = extract_type_from_package(short_name, pkg_path)
             if type_info:
-                if pkg_name_search not in dependencies:
-                    dependencies[pkg_name_search] = {"package": pkg_name_search, "isStdlib": is_stdlib_package(pkg_name_search), "classes": []}
-                dependencies[pkg_name_search]["classes"].append(type_info)
+                add_class(pkg_name_search, type_info)
                 found = True
                 break
 
@@ -932,12 +1507,12 @@ def resolve_transitive_dependencies(api: dict[str, Any], root_path: Path) -> lis
         # Skip stdlib packages — they are tracked via isStdlib flag only when their
         # types can be fully resolved from installed packages.
         if not found:
-            base_name = type_name.split("[")[0]
+            base_name = type_name.partition("[")[0]
             if base_name in _type_collector.import_map:
                 module_path = _type_collector.import_map[base_name]
                 root_pkg = module_path.split(".")[0]
-                if not is_stdlib_package(root_pkg) and root_pkg not in dependencies:
-                    dependencies[root_pkg] = {"package": root_pkg, "isStdlib": False}
+                if not is_stdlib_package(root_pkg):
+                    dependency(root_pkg)
 
     result = []
     for dep_info in dependencies.values():
@@ -948,206 +1523,216 @@ def resolve_transitive_dependencies(api: dict[str, Any], root_path: Path) -> lis
     return sorted(result, key=lambda d: d["package"])
 
 
+# =============================================================================
+# JSON Input/Output
+# =============================================================================
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when available."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. UTF-16 input, which orjson rejects; json detects it
+    return json.loads(data)
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson when available."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. lone surrogates in docstrings, which orjson rejects
+    # Same bytes as orjson: UTF-8 text rather than \uXXXX escapes
+    try:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be encoded as UTF-8; escape them instead
+        return json.dumps(obj, indent=2).encode()
+
+
+def _write_json(obj: Any) -> None:
+    """Write JSON to stdout as a single UTF-8 byte write."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_dump_json(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+
 # =============================================================================
 # Stub Formatting
 # =============================================================================
 
+def _emit_stub_class(w: typing.Callable[[str], Any], cls: dict[str, Any]) -> None:
+    """Write one class (API or dependency) in stub syntax, ending with a blank line."""
+    base = f'({cls["base"]})' if cls.get("base") else ""
+    w(f'class {cls["name"]}{base}:\n')
+    if cls.get("doc"):
+        w(f'    """{cls["doc"]}"""\n')
+
+    for prop in cls.get("properties", []):
+        type_hint = f": {prop['type']}" if prop.get("type") else ""
+        w(f'    {prop["name"]}{type_hint}\n')
+
+    for method in cls.get("methods", []):
+        if method.get("doc"):
+            w(f'    """{method["doc"]}"""\n')
+        if method.get("overload"):
+            w("    @overload\n")
+        if method.get("classmethod"):
+            w("    @classmethod\n")
+        if method.get("staticmethod"):
+            w("    @staticmethod\n")
+        async_prefix = "async " if method.get("async") else ""
+        ret_type = f' -> {method["ret"]}' if method.get("ret") else ""
+        w(f'    {async_prefix}def {method["name"]}({method["sig"]}){ret_type}: ...\n')
+
+    if not cls.get("methods") and not cls.get("properties"):
+        w("    ...\n")
+    w("\n")
+
+
 def format_python_stubs(api: dict[str, Any]) -> str:
     """Format as Python stub syntax."""
-    lines = [
-        f"# {api['package']} - Public API Surface",
-        f"# Graphed by PublicApiGraphEngine.Python",
-        "",
-    ]
+    buf = io.StringIO()
+    _write_python_stubs(api, buf.write)
+    # Every line is newline-terminated and the output always ends with a
+    # blank line; drop the last newline since the caller's print() adds it.
+    return buf.getvalue()[:-1]
+
+
+def _write_python_stubs(api: dict[str, Any], w: typing.Callable[[str], Any]) -> None:
+    """Write Python stub syntax through w, one newline-terminated chunk at a time."""
+    w(f"# {api['package']} - Public API Surface\n"
+      "# Graphed by PublicApiGraphEngine.Python\n"
+      "\n")
 
     for module in api.get("modules", []):
-        lines.append(f"# Module: {module['name']}")
-        lines.append("")
+        w(f"# Module: {module['name']}\n\n")
 
         for func in module.get("functions", []):
             if func.get("doc"):
-                lines.append(f'"""{func["doc"]}"""')
+                w(f'"""{func["doc"]}"""\n')
             if func.get("overload"):
-                lines.append("@overload")
+                w("@overload\n")
             async_prefix = "async " if func.get("async") else ""
             ret_type = f' -> {func["ret"]}' if func.get("ret") else ""
-            lines.append(f'{async_prefix}def {func["name"]}({func["sig"]}){ret_type}: ...')
-            lines.append("")
+            w(f'{async_prefix}def {func["name"]}({func["sig"]}){ret_type}: ...\n\n')
 
         for cls in module.get("classes", []):
-            base = f'({cls["base"]})' if cls.get("base") else ""
-            lines.append(f'class {cls["name"]}{base}:')
-            if cls.get("doc"):
-                lines.append(f'    """{cls["doc"]}"""')
-
-            for prop in cls.get("properties", []):
-                type_hint = f": {prop['type']}" if prop.get("type") else ""
-                lines.append(f'    {prop["name"]}{type_hint}')
-
-            for method in cls.get("methods", []):
-                if method.get("doc"):
-                    lines.append(f'    """{method["doc"]}"""')
-                decorators = []
-                if method.get("overload"):
-                    decorators.append("@overload")
-                if method.get("classmethod"):
-                    decorators.append("@classmethod")
-                if method.get("staticmethod"):
-                    decorators.append("@staticmethod")
-                for dec in decorators:
-                    lines.append(f'    {dec}')
-                async_prefix = "async " if method.get("async") else ""
-                ret_type = f' -> {method["ret"]}' if method.get("ret") else ""
-                lines.append(f'    {async_prefix}def {method["name"]}({method["sig"]}){ret_type}: ...')
-
-            if not cls.get("methods") and not cls.get("properties"):
-                lines.append("    ...")
-            lines.append("")
+            _emit_stub_class(w, cls)
 
     # Add dependency types section
     dependencies = api.get("dependencies", [])
     if dependencies:
-        lines.append("")
-        lines.append("# " + "=" * 77)
-        lines.append("# Dependency Types (from external packages)")
-        lines.append("# " + "=" * 77)
-        lines.append("")
+        rule = "# " + "=" * 77 + "\n"
+        w("\n")
+        w(rule)
+        w("# Dependency Types (from external packages)\n")
+        w(rule)
+        w("\n")
 
         for dep in dependencies:
             pkg_name = dep.get("package", "unknown")
             if dep.get("isStdlib", False):
                 continue
-            lines.append(f"# From: {pkg_name}")
-            lines.append("")
+            w(f"# From: {pkg_name}\n\n")
 
             for cls in dep.get("classes", []):
-                base = f'({cls["base"]})' if cls.get("base") else ""
-                lines.append(f'class {cls["name"]}{base}:')
-                if cls.get("doc"):
-                    lines.append(f'    """{cls["doc"]}"""')
-
-                for prop in cls.get("properties", []):
-                    type_hint = f": {prop['type']}" if prop.get("type") else ""
-                    lines.append(f'    {prop["name"]}{type_hint}')
-
-                for method in cls.get("methods", []):
-                    if method.get("doc"):
-                        lines.append(f'    """{method["doc"]}"""')
-                    decorators = []
-                    if method.get("overload"):
-                        decorators.append("@overload")
-                    if method.get("classmethod"):
-                        decorators.append("@classmethod")
-                    if method.get("staticmethod"):
-                        decorators.append("@staticmethod")
-                    for dec in decorators:
-                        lines.append(f'    {dec}')
-                    async_prefix = "async " if method.get("async") else ""
-                    ret_type = f' -> {method["ret"]}' if method.get("ret") else ""
-                    lines.append(f'    {async_prefix}def {method["name"]}({method["sig"]}){ret_type}: ...')
-
-                if not cls.get("methods") and not cls.get("properties"):
-                    lines.append("    ...")
-                lines.append("")
-
-    return "\n".join(lines)
+                _emit_stub_class(w, cls)
 
 
 # =============================================================================
 # Usage Analysis
 # =============================================================================
 
+# Shared empty defaults for dict.get in hot loops (never mutated)
+_EMPTY_SET: frozenset[str] = frozenset()
+_EMPTY_TUPLE: tuple[Any, ...] = ()
+
+
 def analyze_usage(samples_path: Path, api: dict[str, Any]) -> dict[str, Any]:
     """
     Analyze sample files to find which API operations are used.
     Uses AST-based variable tracking and API return type maps for precise
     receiver resolution — no name-based heuristics.
     """
-    # Build set of client methods from API using graph-based reachability
+    # Build set of client methods from API using graph-based reachability.
+    # A single pass over the API classes collects everything the later
+    # stages need: class_keys[i] is the generic-stripped name of
+    # all_classes[i] and class_bases_list[i] its comma-split base names.
     all_classes: list[dict[str, Any]] = []
-    all_type_names: set[str] = set()
+    class_keys: list[str] = []
+    class_bases_list: list[list[str]] = []
+    derived_by_base: dict[str, list[str]] = {}
     for module in api.get("modules", []):
         for cls in module.get("classes", []):
+            key = sys.intern(cls.get("name", "").partition("[")[0])
             all_classes.append(cls)
-            all_type_names.add(cls.get("name", "").split("[")[0])
+            class_keys.append(key)
+            base_str = cls.get("base")
+            if base_str:
+                derived_by_base.setdefault(base_str.partition("[")[0], []).append(key)
+                class_bases_list.append([b.strip() for b in base_str.split(",")])
+            else:
+                class_bases_list.append([])
+    all_type_names = frozenset(class_keys)
 
     # Build type reference graph
     references: dict[str, set[str]] = {}
-    for cls in all_classes:
-        name = cls.get("name", "").split("[")[0]
-        references[name] = get_referenced_types(cls, all_type_names)
+    for cls, key in zip(all_classes, class_keys):
+        references[key] = get_referenced_types(cls, all_type_names)
 
     referenced_by: dict[str, int] = {}
     for refs in references.values():
         for ref in refs:
             referenced_by[ref] = referenced_by.get(ref, 0) + 1
 
-    operation_types: set[str] = set()
-    for cls in all_classes:
-        if cls.get("methods"):
-            operation_types.add(cls.get("name", "").split("[")[0])
+    operation_types: set[str] = {
+        key for cls, key in zip(all_classes, class_keys) if cls.get("methods")
+    }
 
     # Root classes are determined structurally:
     # 1. Classes marked as entry points (exported from __init__.py) with methods
     # 2. Classes not referenced by any other API type that have methods or reference operation types
-    root_classes = [
-        cls for cls in all_classes
+    root_keys = [
+        key for cls, key in zip(all_classes, class_keys)
         if (cls.get("entryPoint") and cls.get("methods")) or (
-            cls.get("name", "").split("[")[0] not in referenced_by and (
+            key not in referenced_by and (
                 cls.get("methods") or
-                any(ref in operation_types for ref in references.get(cls.get("name", "").split("[")[0], set()))
+                not operation_types.isdisjoint(references.get(key, _EMPTY_SET))
             )
         )
     ]
 
-    if not root_classes:
-        root_classes = [
-            cls for cls in all_classes
+    if not root_keys:
+        root_keys = [
+            key for cls, key in zip(all_classes, class_keys)
             if cls.get("methods") or
-               any(ref in operation_types for ref in references.get(cls.get("name", "").split("[")[0], set()))
+               not operation_types.isdisjoint(references.get(key, _EMPTY_SET))
         ]
 
     # BFS reachability from root classes
-    derived_by_base: dict[str, list[dict[str, Any]]] = {}
-    for cls in all_classes:
-        base_name = cls.get("base")
-        if not base_name:
-            continue
-        base_key = base_name.split("[")[0]
-        derived_by_base.setdefault(base_key, []).append(cls)
-
     reachable: set[str] = set()
     queue: collections.deque[str] = collections.deque()
 
-    for cls in root_classes:
-        name = cls.get("name", "").split("[")[0]
+    for name in root_keys:
         if name not in reachable:
             reachable.add(name)
             queue.append(name)
 
+    # Every queued name is a class key (roots, references and subclasses
+    # all come from class_keys), so edges are followed without a class lookup
     while queue:
         current = queue.popleft()
-        current_cls = next(
-            (cls for cls in all_classes if cls.get("name", "").split("[")[0] == current),
-            None,
-        )
-        if not current_cls:
-            continue
-
-        for ref in references.get(current, set()):
-            if ref not in reachable:
-                reachable.add(ref)
-                queue.append(ref)
-
-        for child in derived_by_base.get(current, []):
-            child_name = child.get("name", "").split("[")[0]
-            if child_name and child_name not in reachable:
-                reachable.add(child_name)
-                queue.append(child_name)
+        for name in (*references.get(current, _EMPTY_SET), *derived_by_base.get(current, _EMPTY_TUPLE)):
+            if name and name not in reachable:
+                reachable.add(name)
+                queue.append(name)
 
     usage_classes = [
-        cls for cls in all_classes
-        if cls.get("name", "").split("[")[0] in reachable and cls.get("methods")
+        cls for cls, key in zip(all_classes, class_keys)
+        if key in reachable and cls.get("methods")
     ]
 
     client_methods: dict[str, set[str]] = {}
@@ -1161,155 +1746,106 @@ def analyze_usage(samples_path: Path, api: dict[str, Any]) -> dict[str, Any]:
         return {"fileCount": 0, "covered": [], "uncovered": [], "patterns": []}
 
     # Build set of known client type names for type inference
-    client_names = set(client_methods.keys())
+    client_names = frozenset(client_methods)
 
     # Build return type maps from API data for precise resolution
-    method_return_type_map = _build_method_return_type_map(api, client_methods)
-    function_return_type_map = _build_function_return_type_map(api, client_methods)
-    property_type_map = _build_property_type_map(api, client_methods)
+    method_return_type_map, function_return_type_map, property_type_map = _build_type_maps(
+        api, client_names
+    )
 
-    # Build inheritance relationships for Strategy 2 disambiguation:
-    # maps each class to its set of base classes that are also client types.
+    # Build inheritance relationships between client types:
+    # _class_bases maps each client class to its client base classes (for
+    # Strategy 2 disambiguation); base_to_subclasses/subclass_to_bases
+    # cross-reference coverage when building the uncovered list.
     _class_bases: dict[str, set[str]] = {}
-    for module in api.get("modules", []):
-        for cls in module.get("classes", []):
-            name = cls.get("name", "")
-            base_str = cls.get("base", "")
-            if name in client_methods and base_str:
-                bases = {b.strip() for b in base_str.split(",") if b.strip() in client_methods}
-                if bases:
-                    _class_bases[name] = bases
+    base_to_subclasses: dict[str, list[str]] = {}
+    subclass_to_bases: dict[str, list[str]] = {}
+    for cls, base_names in zip(all_classes, class_bases_list):
+        client_bases = [b for b in base_names if b and b in client_methods]
+        if not client_bases:
+            continue
+        name = cls.get("name", "")
+        if name in client_methods:
+            _class_bases[name] = set(client_bases)
+        for base in client_bases:
+            base_to_subclasses.setdefault(base, []).append(name)
+            subclass_to_bases.setdefault(name, []).append(base)
+
+    # Invert client_methods so Strategy 2 owners are resolved per method name
+    method_to_clients: dict[str, list[str]] = {}
+    for client_name, methods in client_methods.items():
+        for method_name in methods:
+            method_to_clients.setdefault(method_name, []).append(client_name)
+
+    ctx = _UsageContext(
+        client_methods=client_methods,
+        client_names=client_names,
+        method_return_type_map=method_return_type_map,
+        function_return_type_map=function_return_type_map,
+        property_type_map=property_type_map,
+        method_owners=_resolve_method_owners(method_to_clients, _class_bases),
+        relevant_source_re=_compile_relevant_source_re(method_to_clients),
+    )
+
+    # Find all Python files in samples
+    sample_files = _find_sample_files(samples_path)
+
+    # Files are analyzed independently (in a process pool for large sample
+    # sets), then merged in discovery order so the first occurrence wins.
+    results = _parallel_map(_analyze_sample_file_worker, sample_files, _init_usage_worker, (ctx,))
+    if results is None:
+        results = [_analyze_sample_file(py_file, ctx) for py_file in sample_files]
 
     covered: list[dict[str, Any]] = []
     seen_ops: set[str] = set()
     patterns: set[str] = set()
-    file_count = 0
+    file_count = len(sample_files)
 
-    # Find all Python files in samples
-    for py_file in samples_path.rglob("*.py"):
-        path_parts = py_file.parts
-        if any(part in ('__pycache__', 'venv', '.venv') for part in path_parts):
-            continue
-        filename = py_file.name
-        if filename.startswith('test_') or filename.endswith('_test.py'):
-            continue
-
-        file_count += 1
-        try:
-            code = py_file.read_text(encoding='utf-8')
-            tree = ast.parse(code)
-        except (SyntaxError, UnicodeDecodeError):
+    for py_file, result in zip(sample_files, results):
+        if result is None:
             continue
-
+        hits, file_patterns = result
+        patterns.update(file_patterns)
         rel_path = str(py_file.relative_to(samples_path))
+        for client_name, method_name, line in hits:
+            key = f"{client_name}.{method_name}"
+            if key not in seen_ops:
+                seen_ops.add(key)
+                covered.append({
+                    "client": client_name,
+                    "method": method_name,
+                    "file": rel_path,
+                    "line": line
+                })
 
-        # Build variable → client type map for this file
-        var_types = _build_var_type_map(tree, client_names, method_return_type_map,
-                                        function_return_type_map, property_type_map)
-
-        # Use AST to find method calls with precise receiver resolution
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                method_name, line = extract_call_info(node)
-                if not method_name:
-                    continue
-
-                # Strategy 1: Resolve receiver type from variable tracking
-                resolved_client = _resolve_receiver_type(
-                    node, var_types, client_names,
-                    method_return_type_map, function_return_type_map
-                )
-                if resolved_client and resolved_client in client_methods:
-                    methods = client_methods[resolved_client]
-                    if method_name in methods:
-                        key = f"{resolved_client}.{method_name}"
-                        if key not in seen_ops:
-                            seen_ops.add(key)
-                            covered.append({
-                                "client": resolved_client,
-                                "method": method_name,
-                                "file": rel_path,
-                                "line": getattr(node, 'lineno', 0)
-                            })
-                        continue
-
-                # Strategy 2: Fall back to global method name matching
-                # Only match if the method name is unique to a single client type,
-                # or all candidates share an inheritance chain (inherited method).
-                # (avoids false positives for common names like send, get, list)
-                candidates = [
-                    cn for cn, methods in client_methods.items()
-                    if method_name in methods
-                ]
-                if len(candidates) == 1:
-                    client_name = candidates[0]
-                elif len(candidates) > 1:
-                    # When multiple candidates exist, check if they form a
-                    # single inheritance chain. A candidate is a "root" if none
-                    # of its bases are also in the candidate set.
-                    candidates_set = set(candidates)
-                    roots = [
-                        c for c in candidates
-                        if not (_class_bases.get(c, set()) & candidates_set)
-                    ]
-                    client_name = roots[0] if len(roots) == 1 else None
-                else:
-                    client_name = None
-
-                if client_name is not None:
-                    key = f"{client_name}.{method_name}"
-                    if key not in seen_ops:
-                        seen_ops.add(key)
-                        covered.append({
-                            "client": client_name,
-                            "method": method_name,
-                            "file": rel_path,
-                            "line": getattr(node, 'lineno', 0)
-                        })
-
-        # Detect patterns using AST
-        detect_patterns_ast(tree, patterns)
-
-    # Build base-class ↔ subclass mapping for cross-referencing coverage
-    base_to_subclasses: dict[str, list[str]] = {}
-    subclass_to_bases: dict[str, list[str]] = {}
-    for module in api.get("modules", []):
-        for cls in module.get("classes", []):
-            name = cls.get("name", "")
-            base_str = cls.get("base", "")
-            if base_str:
-                for base in (b.strip() for b in base_str.split(",")):
-                    if base and base in client_methods:
-                        base_to_subclasses.setdefault(base, []).append(name)
-                        subclass_to_bases.setdefault(name, []).append(base)
+    # Build uncovered list from per-client covered method sets, so no
+    # "client.method" keys are formatted for operations already covered
+    covered_methods: dict[str, set[str]] = {}
+    for entry in covered:
+        covered_methods.setdefault(entry["client"], set()).add(entry["method"])
 
-    # Build uncovered list
     uncovered: list[dict[str, str]] = []
     for client_name, methods in client_methods.items():
+        covered_here = covered_methods.get(client_name, _EMPTY_SET)
+        if len(covered_here) == len(methods):
+            continue  # covered methods are always a subset of the client's
+        # Methods covered through a base/subclass relationship also count
+        related = [
+            covered_methods[r]
+            for r in (*subclass_to_bases.get(client_name, _EMPTY_TUPLE),
+                      *base_to_subclasses.get(client_name, _EMPTY_TUPLE))
+            if r in covered_methods
+        ]
         for method in methods:
-            key = f"{client_name}.{method}"
-            if key in seen_ops:
+            if method in covered_here:
                 continue
-
-            # Check if covered through a base/subclass relationship
-            covered_via_related = False
-            if client_name in subclass_to_bases:
-                covered_via_related = any(
-                    f"{base}.{method}" in seen_ops
-                    for base in subclass_to_bases[client_name]
-                )
-            if not covered_via_related and client_name in base_to_subclasses:
-                covered_via_related = any(
-                    f"{sub}.{method}" in seen_ops
-                    for sub in base_to_subclasses[client_name]
-                )
-
-            if not covered_via_related:
-                uncovered.append({
-                    "client": client_name,
-                    "method": method,
-                    "sig": f"{method}(...)"
-                })
+            if any(method in related_methods for related_methods in related):
+                continue
+            uncovered.append({
+                "client": client_name,
+                "method": method,
+                "sig": f"{method}(...)"
+            })
 
     return {
         "fileCount": file_count,
@@ -1319,115 +1855,300 @@ def analyze_usage(samples_path: Path, api: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+# Directories under a samples tree that never hold sample code
+_SAMPLE_SKIP_DIR_NAMES = frozenset({'__pycache__', 'venv', '.venv'})
+
+
+def _find_sample_files(samples_path: Path) -> list[Path]:
+    """
+    List sample .py files depth-first, pruning cache and virtualenv
+    directories instead of walking into them and filtering every file.
+    """
+    sample_files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(samples_path):
+        dirnames[:] = [d for d in dirnames if d not in _SAMPLE_SKIP_DIR_NAMES]
+        for filename in filenames:
+            if not filename.endswith('.py'):
+                continue
+            if filename.startswith(_TEST_FILE_PREFIXES) or filename.endswith(_TEST_FILE_SUFFIXES):
+                continue
+            sample_files.append(Path(dirpath, filename))
+    return sample_files
+
+
+class _UsageContext(typing.NamedTuple):
+    """Read-only API data shared by every sample file in analyze_usage."""
+    client_methods: dict[str, set[str]]
+    client_names: frozenset[str]
+    method_return_type_map: dict[str, str]
+    function_return_type_map: dict[str, str]
+    property_type_map: dict[str, str]
+    method_owners: dict[str, str | None]
+    relevant_source_re: re.Pattern[bytes]
+
+
+def _analyze_sample_file(
+    py_file: Path,
+    ctx: _UsageContext
+) -> tuple[list[tuple[str, str, int]], set[str]] | None:
+    """
+    Find covered client operations and usage patterns in one sample file.
+
+    Returns (hits, patterns), where hits are (client, method, line) tuples
+    in call order, first occurrence per operation only. Returns None if the
+    file cannot be parsed.
+    """
+    source = py_file.read_bytes()
+    # A file can only produce hits by naming a client method, and only
+    # produce patterns through async/await/try, so skip parsing the rest.
+    if ctx.relevant_source_re.search(source) is None:
+        return [], set()
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, UnicodeDecodeError):
+        return None
+
+    client_methods = ctx.client_methods
+    client_names = ctx.client_names
+    method_return_type_map = ctx.method_return_type_map
+    function_return_type_map = ctx.function_return_type_map
+    method_owners = ctx.method_owners
+
+    hits: list[tuple[str, str, int]] = []
+    seen_ops: set[str] = set()
+    patterns: set[str] = set()
+
+    # Single traversal: collect assignments and calls, detect patterns
+    assignments, calls = _scan_sample_tree(tree, method_owners, patterns)
+
+    # Build variable → client type map for this file
+    var_types = _build_var_type_map(assignments, client_names, method_return_type_map,
+                                    function_return_type_map, ctx.property_type_map)
+
+    # Use AST to find method calls with precise receiver resolution
+    for node in calls:
+        method_name = node.func.attr
+
+        # Strategy 1: Resolve receiver type from variable tracking
+        resolved_client = _resolve_receiver_type(
+            node, var_types, client_names,
+            method_return_type_map, function_return_type_map
+        )
+        if resolved_client and resolved_client in client_methods:
+            methods = client_methods[resolved_client]
+            if method_name in methods:
+                key = f"{resolved_client}.{method_name}"
+                if key not in seen_ops:
+                    seen_ops.add(key)
+                    hits.append((resolved_client, method_name, getattr(node, 'lineno', 0)))
+                continue
+
+        # Strategy 2: Fall back to global method name matching, resolved
+        # per method name up front (see _resolve_method_owners)
+        client_name = method_owners.get(method_name)
+
+        if client_name is not None:
+            key = f"{client_name}.{method_name}"
+            if key not in seen_ops:
+                seen_ops.add(key)
+                hits.append((client_name, method_name, getattr(node, 'lineno', 0)))
+
+    return hits, patterns
+
+
+def _resolve_method_owners(
+    method_to_clients: dict[str, list[str]],
+    class_bases: dict[str, set[str]]
+) -> dict[str, str | None]:
+    """
+    Resolve each method name to the single client it belongs to, or None.
+
+    A method name matches only if it is unique to a single client type, or
+    all candidates share an inheritance chain (inherited method). This
+    avoids false positives for common names like send, get, list. The
+    answer depends only on the method name, so it is computed once here
+    rather than at every call site.
+    """
+    owners: dict[str, str | None] = {}
+    for method_name, candidates in method_to_clients.items():
+        if len(candidates) == 1:
+            owners[method_name] = candidates[0]
+            continue
+        # When multiple candidates exist, check if they form a
+        # single inheritance chain. A candidate is a "root" if none
+        # of its bases are also in the candidate set.
+        candidates_set = set(candidates)
+        roots = [
+            c for c in candidates
+            if not (class_bases.get(c, _EMPTY_SET) & candidates_set)
+        ]
+        owners[method_name] = roots[0] if len(roots) == 1 else None
+    return owners
+
+
+def _compile_relevant_source_re(method_names: typing.Iterable[str]) -> re.Pattern[bytes]:
+    """
+    Compile a pattern matching any source that _analyze_sample_file could
+    take something from: a client method name or an async/try keyword.
+
+    The pattern runs on raw UTF-8 bytes, where a plain word-boundary
+    assertion would split non-ASCII identifiers (PEP 3131), so identifier
+    edges are spelled out with bytes >= 0x80 counted as word characters.
+    """
+    words = sorted({'async', 'await', 'try', *method_names}, key=len, reverse=True)
+    return re.compile(
+        rb'(?<![A-Za-z0-9_\x80-\xff])(?:'
+        + b'|'.join(re.escape(w.encode()) for w in words)
+        + rb')(?![A-Za-z0-9_\x80-\xff])'
+    )
+
+
+# Set in each pool worker by _init_usage_worker
+_usage_context: _UsageContext | None = None
+
+
+def _init_usage_worker(ctx: _UsageContext) -> None:
+    """Pool initializer: receive the shared usage context once per worker."""
+    global _usage_context
+    _usage_context = ctx
+
+
+def _analyze_sample_file_worker(py_file: Path) -> tuple[list[tuple[str, str, int]], set[str]] | None:
+    """Pool entry point for _analyze_sample_file."""
+    assert _usage_context is not None
+    return _analyze_sample_file(py_file, _usage_context)
+
+
 # =============================================================================
 # Usage Analysis Helpers
 # =============================================================================
 
-def _tokenize_identifiers(text: str) -> set[str]:
-    """Tokenize a string into identifier tokens (split on non-alphanumeric/underscore).
-
-    This prevents substring false positives like 'Policy' matching inside 'PolicyList'.
-    """
-    import re
-    return set(re.findall(r'[A-Za-z_]\w*', text))
+# Identifier tokens (split on non-alphanumeric/underscore). Matching whole
+# tokens prevents substring false positives like 'Policy' inside 'PolicyList'.
+_IDENT_RE = re.compile(r'[A-Za-z_]\w*')
 
 
-def get_referenced_types(cls: dict[str, Any], all_type_names: set[str]) -> set[str]:
+def get_referenced_types(cls: dict[str, Any], all_type_names: frozenset[str]) -> set[str]:
     """Get all type names referenced by a class (base, methods, properties)."""
     refs: set[str] = set()
 
     base = cls.get("base")
     if base:
-        base_name = base.split("[")[0]
+        base_name = base.partition("[")[0]
         if base_name in all_type_names:
             refs.add(base_name)
 
-    for method in cls.get("methods", []) or []:
-        sig = method.get("sig", "")
-        ret = method.get("ret", "")
-        tokens = _tokenize_identifiers(sig) | _tokenize_identifiers(ret)
-        refs.update(tokens & all_type_names)
-
-    for prop in cls.get("properties", []) or []:
-        ptype = prop.get("type") or ""
-        tokens = _tokenize_identifiers(ptype)
-        refs.update(tokens & all_type_names)
+    # Tokenize all member signatures and property types in one regex pass
+    texts = [f"{method.get('sig', '')} {method.get('ret', '')}" for method in cls.get("methods", []) or []]
+    texts.extend(prop.get("type") or "" for prop in cls.get("properties", []) or [])
+    if texts:
+        refs.update(all_type_names.intersection(_IDENT_RE.findall(" ".join(texts))))
 
     return refs
 
 
-def extract_call_info(node: ast.Call) -> tuple[str | None, int]:
-    """Extract method name from a Call node using AST."""
-    if isinstance(node.func, ast.Attribute):
-        return node.func.attr, getattr(node, 'lineno', 0)
-    return None, 0
+_ASYNC_WRAPPER_RE = re.compile(r'(Awaitable|Coroutine|AsyncIterator|AsyncIterable)\[(.*)\]', re.DOTALL)
 
 
 def _unwrap_async_return_type(ret_type: str) -> str:
     """Unwrap async wrapper types: Awaitable[X] → X, Coroutine[..., X] → X."""
-    for wrapper in ("Awaitable", "Coroutine", "AsyncIterator", "AsyncIterable"):
-        if ret_type.startswith(wrapper + "[") and ret_type.endswith("]"):
-            inner = ret_type[len(wrapper) + 1:-1]
-            if wrapper == "Coroutine":
-                parts = inner.rsplit(",", 1)
-                if len(parts) == 2:
-                    return parts[1].strip()
-            return inner
-    return ret_type
-
-
-def _build_method_return_type_map(api: dict[str, Any], client_methods: dict[str, set[str]]) -> dict[str, str]:
-    """Build (ClassName.method_name) → ReturnType map from API method return types."""
-    result: dict[str, str] = {}
+    m = _ASYNC_WRAPPER_RE.fullmatch(ret_type)
+    if not m:
+        return ret_type
+    wrapper, inner = m.groups()
+    if wrapper == "Coroutine":
+        parts = inner.rsplit(",", 1)
+        if len(parts) == 2:
+            return parts[1].strip()
+    return inner
+
+
+def _build_type_maps(
+    api: dict[str, Any],
+    client_names: frozenset[str]
+) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    """
+    Build the return type maps used for receiver resolution, in one pass:
+
+      - (ClassName.method_name) → ReturnType from API method return types
+      - function_name → ReturnType from API function return types
+      - (ClassName.prop_name) → ReturnType from API property types
+
+    Only types that are client classes are recorded.
+    """
+    unwrap = _unwrap_async_return_type
+    method_map: dict[str, str] = {}
+    function_map: dict[str, str] = {}
+    property_map: dict[str, str] = {}
     for module in api.get("modules", []):
         for cls in module.get("classes", []):
             cls_name = cls.get("name", "")
             for method in cls.get("methods", []):
                 ret = method.get("ret")
                 if ret:
-                    unwrapped = _unwrap_async_return_type(ret).split("[")[0].strip()
-                    if unwrapped in client_methods:
-                        result[f"{cls_name}.{method['name']}"] = unwrapped
-    return result
-
-
-def _build_function_return_type_map(api: dict[str, Any], client_methods: dict[str, set[str]]) -> dict[str, str]:
-    """Build function_name → ReturnType map from API function return types."""
-    result: dict[str, str] = {}
-    for module in api.get("modules", []):
+                    unwrapped = unwrap(ret).partition("[")[0].strip()
+                    if unwrapped in client_names:
+                        method_map[f"{cls_name}.{method['name']}"] = unwrapped
+            for prop in cls.get("properties", []):
+                prop_type = prop.get("type")
+                if prop_type:
+                    base_type = prop_type.partition("[")[0].strip()
+                    if base_type in client_names:
+                        property_map[f"{cls_name}.{prop['name']}"] = base_type
         for func in module.get("functions", []):
             ret = func.get("ret")
             if ret:
-                unwrapped = _unwrap_async_return_type(ret).split("[")[0].strip()
-                if unwrapped in client_methods:
-                    result[func["name"]] = unwrapped
-    return result
+                unwrapped = unwrap(ret).partition("[")[0].strip()
+                if unwrapped in client_names:
+                    function_map[func["name"]] = unwrapped
+    return method_map, function_map, property_map
 
 
-def _build_property_type_map(api: dict[str, Any], client_methods: dict[str, set[str]]) -> dict[str, str]:
-    """Build (ClassName.prop_name) → ReturnType map from API property types."""
-    result: dict[str, str] = {}
-    for module in api.get("modules", []):
-        for cls in module.get("classes", []):
-            cls_name = cls.get("name", "")
-            for prop in cls.get("properties", []):
-                prop_type = prop.get("type")
-                if prop_type:
-                    base_type = prop_type.split("[")[0].strip()
-                    if base_type in client_methods:
-                        result[f"{cls_name}.{prop['name']}"] = base_type
-    return result
+def _scan_sample_tree(
+    tree: ast.AST,
+    method_names: typing.Container[str],
+    patterns: set[str]
+) -> tuple[list[ast.Assign | ast.AnnAssign], list[ast.Call]]:
+    """
+    Walk a sample file's AST once, collecting what usage analysis needs.
+
+    Returns the assignment nodes and the method calls (obj.name(...) with
+    name in method_names) in ast.walk order, and records structural usage
+    patterns (async, error-handling, streaming) as a side effect, so each
+    file is traversed a single time.
+    """
+    assignments: list[ast.Assign | ast.AnnAssign] = []
+    calls: list[ast.Call] = []
+
+    for node in ast.walk(tree):
+        t = type(node)
+        if t is ast.Call:
+            func = node.func
+            if type(func) is ast.Attribute and func.attr in method_names:
+                calls.append(node)
+        elif t is ast.Assign or t is ast.AnnAssign:
+            assignments.append(node)
+        elif t is ast.Await or t is ast.AsyncWith:
+            patterns.add("async")
+        elif t is ast.AsyncFor:
+            patterns.add("async")
+            patterns.add("streaming")
+        elif t is ast.Try:
+            patterns.add("error-handling")
+
+    return assignments, calls
 
 
 def _build_var_type_map(
-    tree: ast.AST,
-    client_names: set[str],
+    assignments: list[ast.Assign | ast.AnnAssign],
+    client_names: frozenset[str],
     method_return_type_map: dict[str, str],
     function_return_type_map: dict[str, str],
     property_type_map: dict[str, str]
 ) -> dict[str, str]:
     """
-    Walk a Python AST and track variable-to-client-type mappings.
+    Track variable-to-client-type mappings from a file's assignments
+    (in ast.walk order, as collected by _scan_sample_tree).
     All type resolution is driven by API index data — no name-based heuristics.
 
     Patterns tracked:
@@ -1441,7 +2162,7 @@ def _build_var_type_map(
     """
     var_types: dict[str, str] = {}
 
-    for node in ast.walk(tree):
+    for node in assignments:
         # Handle: client = ChatClient(...) or client = service.method()
         if isinstance(node, ast.Assign):
             rhs_type = _infer_type_from_expr(node.value, client_names, var_types,
@@ -1468,14 +2189,14 @@ def _build_var_type_map(
 
 def _assign_var_type(target: ast.AST, type_name: str, var_types: dict[str, str]) -> None:
     """Assign a type to a variable target (Name or Attribute)."""
-    if isinstance(target, ast.Name):
+    t = type(target)
+    if t is ast.Name:
         var_types[target.id] = type_name
-    elif isinstance(target, ast.Attribute):
-        key = f"{_expr_to_str(target.value)}.{target.attr}"
-        var_types[key] = type_name
+    elif t is ast.Attribute:
+        var_types[_expr_to_str(target)] = type_name
 
 
-def _extract_client_type_from_annotation(ann: ast.AST, client_names: set[str]) -> str | None:
+def _extract_client_type_from_annotation(ann: ast.AST, client_names: frozenset[str]) -> str | None:
     """Extract a client type name from a type annotation."""
     if isinstance(ann, ast.Name) and ann.id in client_names:
         return ann.id
@@ -1487,7 +2208,7 @@ def _extract_client_type_from_annotation(ann: ast.AST, client_names: set[str]) -
 
 def _infer_type_from_expr(
     expr: ast.AST,
-    client_names: set[str],
+    client_names: frozenset[str],
     var_types: dict[str, str],
     method_return_type_map: dict[str, str],
     function_return_type_map: dict[str, str],
@@ -1504,12 +2225,17 @@ def _infer_type_from_expr(
       - service.get_chat_client()  → via method return type map
       - client.sub_prop            → via property type map
     """
+    t = type(expr)
+
     # Property access: client.sub_prop
-    if isinstance(expr, ast.Attribute) and isinstance(expr.value, (ast.Name, ast.Attribute)):
-        if isinstance(expr.value, ast.Name):
-            receiver_type = var_types.get(expr.value.id)
+    if t is ast.Attribute:
+        value = expr.value
+        if type(value) is ast.Name:
+            receiver_type = var_types.get(value.id)
+        elif type(value) is ast.Attribute:
+            receiver_type = var_types.get(_expr_to_str(value))
         else:
-            receiver_type = var_types.get(_expr_to_str(expr.value))
+            return None
         if receiver_type:
             prop_key = f"{receiver_type}.{expr.attr}"
             prop_type = property_type_map.get(prop_key)
@@ -1517,28 +2243,28 @@ def _infer_type_from_expr(
                 return prop_type
         return None
 
-    if not isinstance(expr, ast.Call):
+    if t is not ast.Call:
         return None
 
     func = expr.func
 
     # Direct constructor: ChatClient(...)
-    if isinstance(func, ast.Name):
+    if type(func) is ast.Name:
         if func.id in client_names:
             return func.id
         # Function call: create_chat_client() → via function return type map
         return function_return_type_map.get(func.id)
 
     # Qualified access: module.ChatClient(...) or service.method(...)
-    if isinstance(func, ast.Attribute):
+    if type(func) is ast.Attribute:
         # Constructor: module.ChatClient(...)
         if func.attr in client_names:
             return func.attr
         # Class method factory: ChatClient.from_config(...)
-        if isinstance(func.value, ast.Name) and func.value.id in client_names:
+        if type(func.value) is ast.Name and func.value.id in client_names:
             return func.value.id
         # Instance method: service.get_chat_client() → via method return type map
-        if isinstance(func.value, ast.Name):
+        if type(func.value) is ast.Name:
             receiver_type = var_types.get(func.value.id)
             if receiver_type:
                 method_key = f"{receiver_type}.{func.attr}"
@@ -1553,15 +2279,23 @@ def _expr_to_str(expr: ast.AST) -> str:
     """Convert a simple expression to a string for use as map key."""
     if isinstance(expr, ast.Name):
         return expr.id
-    if isinstance(expr, ast.Attribute):
-        return f"{_expr_to_str(expr.value)}.{expr.attr}"
-    return "?"
+    if not isinstance(expr, ast.Attribute):
+        return "?"
+    # Walk the attribute chain once and join, rather than re-concatenating
+    # the growing prefix at every level.
+    parts: list[str] = []
+    while isinstance(expr, ast.Attribute):
+        parts.append(expr.attr)
+        expr = expr.value
+    parts.append(expr.id if isinstance(expr, ast.Name) else "?")
+    parts.reverse()
+    return ".".join(parts)
 
 
 def _resolve_receiver_type(
     node: ast.Call,
     var_types: dict[str, str],
-    client_names: set[str],
+    client_names: frozenset[str],
     method_return_type_map: dict[str, str],
     function_return_type_map: dict[str, str]
 ) -> str | None:
@@ -1573,31 +2307,28 @@ def _resolve_receiver_type(
     For self.client.send(), looks up 'self.client' in var_types.
     For get_client().send(), looks up function return type from API data.
     """
-    if not isinstance(node.func, ast.Attribute):
+    if type(node.func) is not ast.Attribute:
         return None
 
     receiver = node.func.value
+    t = type(receiver)
 
     # Simple variable: client.send()
-    if isinstance(receiver, ast.Name):
+    if t is ast.Name:
         return var_types.get(receiver.id)
 
     # Attribute access: self.client.send()
-    if isinstance(receiver, ast.Attribute):
-        key = f"{_expr_to_str(receiver.value)}.{receiver.attr}"
-        resolved = var_types.get(key)
-        if resolved:
-            return resolved
-        return var_types.get(receiver.attr)
+    if t is ast.Attribute:
+        return var_types.get(_expr_to_str(receiver)) or var_types.get(receiver.attr)
 
     # Chained call: get_client().send() — resolve from API return type data
-    if isinstance(receiver, ast.Call):
+    if t is ast.Call:
         func = receiver.func
         # Standalone function: create_client().send()
-        if isinstance(func, ast.Name):
+        if type(func) is ast.Name:
             return function_return_type_map.get(func.id)
         # Method call: service.get_client().send()
-        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        if type(func) is ast.Attribute and type(func.value) is ast.Name:
             receiver_type = var_types.get(func.value.id)
             if receiver_type:
                 method_key = f"{receiver_type}.{func.attr}"
@@ -1606,30 +2337,6 @@ def _resolve_receiver_type(
     return None
 
 
-def detect_patterns_ast(tree: ast.AST, patterns: set[str]) -> None:
-    """Detect usage patterns using purely structural AST analysis.
-
-    Only reports patterns that are provable from AST node types —
-    no keyword substring matching.
-    """
-    has_async = False
-    has_error_handling = False
-    has_streaming = False
-
-    for node in ast.walk(tree):
-        if not has_async and isinstance(node, (ast.Await, ast.AsyncWith, ast.AsyncFor)):
-            patterns.add("async")
-            has_async = True
-        if not has_error_handling and isinstance(node, ast.Try):
-            patterns.add("error-handling")
-            has_error_handling = True
-        if not has_streaming and isinstance(node, ast.AsyncFor):
-            patterns.add("streaming")
-            has_streaming = True
-        if has_async and has_error_handling and has_streaming:
-            break
-
-
 def _iter_annotation_runtime_types(annotation: Any) -> list[Any]:
     """Flatten a typing annotation into runtime type objects where possible."""
     if annotation is inspect.Parameter.empty or annotation is None:
@@ -1714,13 +2421,14 @@ def _build_runtime_import_map(module: Any) -> dict[str, str]:
         return {}
 
     try:
-        source = module_path.read_text(encoding="utf-8")
-        tree = ast.parse(source)
+        tree = _parse_file(module_path)
     except Exception:
         return {}
+    if tree is None:
+        return {}
 
     import_map: dict[str, str] = {}
-    for node in ast.walk(tree):
+    for node in _walk_statements(tree):
         if isinstance(node, ast.ImportFrom):
             if not node.module or node.module == "__future__":
                 continue
@@ -1925,6 +2633,9 @@ def extract_package_inspect(import_name: str) -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    # Required for the extraction process pool in PyInstaller-frozen builds
+    multiprocessing.freeze_support()
+
     if len(sys.argv) < 2:
         print("Usage: python graph_api.py <path> [--json] [--stub] [--usage <api_json> <samples_path>]", file=sys.stderr)
         sys.exit(1)
@@ -1940,14 +2651,14 @@ if __name__ == "__main__":
 
         # Load API index (read from stdin when path is '-')
         if api_json_path == '-':
-            api = json.load(sys.stdin)
+            api = _load_json(sys.stdin.buffer.read())
         else:
-            with open(api_json_path, 'r') as f:
-                api = json.load(f)
+            with open(api_json_path, 'rb') as f:
+                api = _load_json(f.read())
 
         # Analyze usage
         usage = analyze_usage(samples_path, api)
-        print(json.dumps(usage, indent=2))
+        _write_json(usage)
         sys.exit(0)
 
     mode = "ast"
@@ -1978,6 +2689,8 @@ if __name__ == "__main__":
         api = extract_package(root)
 
     if output_json:
-        print(json.dumps(api, indent=2))
+        _write_json(api)
     elif output_stub:
-        print(format_python_stubs(api))
+        # Stream straight into stdout's buffer instead of building the text
+        _write_python_stubs(api, sys.stdout.write)
+        sys.stdout.flush()
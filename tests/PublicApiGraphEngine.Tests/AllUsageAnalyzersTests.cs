@@ -399,6 +399,66 @@ def main():
         Assert.Contains(result.UncoveredOperations, o => o.Operation == "process_data");
     }
 
+    [Fact]
+    public async Task Python_NonAsciiMethodName_Covered()
+    {
+        if (!_pythonAnalyzer.IsAvailable()) Assert.Skip("Python not available");
+
+        // PEP 3131 identifiers: the source pre-filter must not treat the
+        // UTF-8 bytes of "é" as a word boundary and skip the file
+        var apiIndex = CreatePythonApiIndex(
+            classes: [("CafeClient", ["café", "thé"])],
+            functions: []);
+
+        await WriteFileAsync("sample.py", """
+client = CafeClient()
+client.café()
+# thé is not called
+""");
+
+        var result = await _pythonAnalyzer.AnalyzeAsync(_tempDir, apiIndex);
+
+        Assert.Contains(result.CoveredOperations, o => o.ClientType == "CafeClient" && o.Operation == "café");
+        Assert.Contains(result.UncoveredOperations, o => o.ClientType == "CafeClient" && o.Operation == "thé");
+    }
+
+    [Fact]
+    public async Task Python_ParallelAnalysis_MatchesSerialAnalysis()
+    {
+        if (!_pythonAnalyzer.IsAvailable()) Assert.Skip("Python not available");
+
+        // 64 or more sample files are analyzed in a process pool; each half
+        // on its own stays below that threshold and is analyzed serially
+        const int fileCount = 64;
+        var apiIndex = CreatePythonApiIndex(
+            classes: [("WidgetClient", [.. Enumerable.Range(0, fileCount).Select(i => $"op_{i:D2}"), "never_called"])],
+            functions: []);
+
+        for (var i = 0; i < fileCount; i++)
+        {
+            var content = $"""
+                client = WidgetClient()
+                client.op_{i:D2}()
+                """;
+            var fileName = Path.Combine("examples", $"example_{i:D2}.py");
+            await WriteFileAsync(Path.Combine("pooled", fileName), content);
+            await WriteFileAsync(Path.Combine(i < fileCount / 2 ? "serial_a" : "serial_b", fileName), content);
+        }
+
+        var pooled = await _pythonAnalyzer.AnalyzeAsync(Path.Combine(_tempDir, "pooled"), apiIndex);
+        var serialA = await _pythonAnalyzer.AnalyzeAsync(Path.Combine(_tempDir, "serial_a"), apiIndex);
+        var serialB = await _pythonAnalyzer.AnalyzeAsync(Path.Combine(_tempDir, "serial_b"), apiIndex);
+
+        Assert.Equal(fileCount, pooled.FileCount);
+        Assert.Equal(serialA.FileCount + serialB.FileCount, pooled.FileCount);
+        // Sample discovery follows directory listing order, so compare as sets
+        Assert.Equal(
+            serialA.CoveredOperations.Concat(serialB.CoveredOperations).OrderBy(o => o.Operation),
+            pooled.CoveredOperations.OrderBy(o => o.Operation));
+        var uncovered = Assert.Single(pooled.UncoveredOperations);
+        Assert.Equal("never_called", uncovered.Operation);
+    }
+
     [Fact]
     public async Task Python_Subclient_MethodsTrackedSeparately()
     {
@@ -1,7 +1,9 @@
 // Copyright (c) Microsoft Corporation.
 // Licensed under the MIT License.
 
+using System.Text;
 using System.Text.Json;
+using PublicApiGraphEngine.Contracts;
 using PublicApiGraphEngine.Python;
 using Xunit;
 
@@ -446,3 +448,258 @@ public class PythonCompiledFixtureTests : IClassFixture<PythonCompiledFixture>
             d.Package.Contains("some_http_lib", StringComparison.OrdinalIgnoreCase));
     }
 }
+
+/// <summary>
+/// Tests that graph small Python packages written to a temp directory,
+/// for layouts that do not belong in the shared fixtures.
+/// </summary>
+public class PythonSourceLayoutTests : IDisposable
+{
+    private readonly string _tempDir;
+
+    public PythonSourceLayoutTests()
+    {
+        _tempDir = Path.Combine(Path.GetTempPath(), $"py_layout_{Guid.NewGuid():N}");
+        Directory.CreateDirectory(_tempDir);
+    }
+
+    public void Dispose()
+    {
+        try { Directory.Delete(_tempDir, true); } catch { }
+    }
+
+    private void WriteFile(string relativePath, string content, Encoding? encoding = null)
+    {
+        var path = Path.Combine(_tempDir, relativePath);
+        Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+        File.WriteAllText(path, content, encoding ?? new UTF8Encoding(encoderShouldEmitUTF8Identifier: false));
+    }
+
+    private async Task<ApiIndex> GraphAsync(string relativeRoot = "")
+    {
+        var engine = new PythonPublicApiGraphEngine();
+        if (!engine.IsAvailable()) Assert.Skip(engine.UnavailableReason ?? "Python not available");
+        return await engine.GraphAsync(Path.Combine(_tempDir, relativeRoot));
+    }
+
+    /// <summary>
+    /// Imports are resolved in ast.walk (breadth-first) order with later
+    /// visits winning, so the TYPE_CHECKING import nested one level down
+    /// overrides the same-named top-level import that follows it.
+    /// </summary>
+    [Fact]
+    public async Task ImportMap_NestedImportOverridesTopLevelImport()
+    {
+        WriteFile("pkg/__init__.py", """
+            from typing import TYPE_CHECKING
+
+            if TYPE_CHECKING:
+                from pkg_a import Widget
+
+            from pkg_b import Widget
+
+
+            def use(widget: Widget) -> None:
+                pass
+            """);
+
+        var api = await GraphAsync();
+
+        Assert.NotNull(api.Dependencies);
+        Assert.Contains(api.Dependencies, d => d.Package == "pkg_a");
+        Assert.DoesNotContain(api.Dependencies, d => d.Package == "pkg_b");
+    }
+
+    [Fact]
+    public async Task SourceDiscovery_IncludesNamesContainingTestSubstring()
+    {
+        WriteFile("pkg/__init__.py", "");
+        // "test_" appears inside these names without being a test prefix
+        WriteFile("pkg/latest_version.py", "def latest_version() -> str:\n    pass\n");
+        WriteFile("pkg/pytest_plugin.py", "def pytest_configure(config) -> None:\n    pass\n");
+
+        var api = await GraphAsync();
+
+        var moduleNames = api.Modules.Select(m => m.Name).ToList();
+        Assert.Contains("pkg.latest_version", moduleNames);
+        Assert.Contains("pkg.pytest_plugin", moduleNames);
+    }
+
+    [Fact]
+    public async Task SourceDiscovery_DecodesBomAndDeclaredEncodings()
+    {
+        WriteFile("pkg/__init__.py", "");
+        WriteFile("pkg/bom_module.py", "def bom_function() -> None:\n    pass\n",
+            new UTF8Encoding(encoderShouldEmitUTF8Identifier: true));
+        WriteFile("pkg/latin1_module.py", """"
+            # -*- coding: latin-1 -*-
+            def latin1_function() -> str:
+                """Return café."""
+            """", Encoding.Latin1);
+
+        var api = await GraphAsync();
+
+        var functions = api.Modules.SelectMany(m => m.Functions ?? []).ToList();
+        Assert.Contains(functions, f => f.Name == "bom_function");
+        var latin1 = Assert.Single(functions, f => f.Name == "latin1_function");
+        Assert.Equal("Return café.", latin1.Doc);
+    }
+
+    [Theory]
+    [InlineData("pkg/test_client.py")]
+    [InlineData("pkg/client_test.py")]
+    [InlineData("pkg/_private.py")]
+    [InlineData("pkg/tests/helpers.py")]
+    [InlineData("pkg/test_data/loader.py")]
+    [InlineData("venv/lib/venv_module.py")]
+    [InlineData(".venv/lib/venv_module.py")]
+    [InlineData("node_modules/lib/node_module.py")]
+    [InlineData("build/lib/build_module.py")]
+    [InlineData("pkg.egg-info/egg_module.py")]
+    public async Task SourceDiscovery_SkipsTestPrivateAndBuildFiles(string relativePath)
+    {
+        WriteFile("pkg/__init__.py", "");
+        WriteFile("pkg/client.py", "def public_function() -> None:\n    pass\n");
+        WriteFile(relativePath, "def skipped_function() -> None:\n    pass\n");
+
+        var api = await GraphAsync();
+
+        var functions = api.Modules.SelectMany(m => m.Functions ?? []).Select(f => f.Name).ToList();
+        Assert.Contains("public_function", functions);
+        Assert.DoesNotContain("skipped_function", functions);
+    }
+
+    [Fact]
+    public async Task SourceDiscovery_SkipsFileWithNulBytes()
+    {
+        WriteFile("pkg/__init__.py", "");
+        WriteFile("pkg/client.py", "def public_function() -> None:\n    pass\n");
+        WriteFile("pkg/corrupt.py", "def corrupt_function() -> None:\n    pass\n\0\n");
+
+        var api = await GraphAsync();
+
+        var functions = api.Modules.SelectMany(m => m.Functions ?? []).Select(f => f.Name).ToList();
+        Assert.Contains("public_function", functions);
+        Assert.DoesNotContain("corrupt_function", functions);
+    }
+
+    [Fact]
+    public async Task ModuleNames_KeepPySubstringsInPath()
+    {
+        WriteFile("pkg/__init__.py", "");
+        WriteFile("pkg/lexers/__init__.py", "");
+        WriteFile("pkg/lexers/pygments.py", "def get_lexer() -> None:\n    pass\n");
+        WriteFile("pkg/types/py_token.py", "def tokenize() -> None:\n    pass\n");
+
+        var api = await GraphAsync();
+
+        var moduleNames = api.Modules.Select(m => m.Name).ToList();
+        Assert.Contains("pkg.lexers.pygments", moduleNames);
+        Assert.Contains("pkg.types.py_token", moduleNames);
+    }
+
+    /// <summary>
+    /// The engine writes JSON as raw UTF-8. The buffered path (Docker and
+    /// --usage) must decode it as UTF-8 rather than the platform default.
+    /// </summary>
+    [Fact]
+    public async Task BufferedJsonOutput_NonAsciiText_RoundTrips()
+    {
+        var availability = new EngineAvailabilityProvider(PythonPublicApiGraphEngine.SharedConfig).GetAvailability();
+        if (availability.Mode != EngineMode.RuntimeInterpreter) Assert.Skip("Python interpreter not available");
+
+        WriteFile("pkg/__init__.py", """"
+            def café() -> None:
+                """Prépare un café ☕."""
+            """");
+
+        var result = await ProcessSandbox.ExecuteAsync(
+            availability.ExecutablePath!,
+            [Path.Combine(AppContext.BaseDirectory, "graph_api.py"), _tempDir, "--json"]);
+
+        Assert.True(result.Success, result.StandardError);
+        var raw = JsonSerializer.Deserialize(result.StandardOutput, RawPythonJsonContext.Default.RawPythonApiIndex);
+        var function = Assert.Single(raw!.Modules!.SelectMany(m => m.Functions ?? []));
+        Assert.Equal("café", function.Name);
+        Assert.Equal("Prépare un café ☕.", function.Doc);
+    }
+
+    /// <summary>
+    /// Without packaging metadata the package name comes from the shortest
+    /// __init__.py path; equal lengths are broken by name, not listing order.
+    /// </summary>
+    [Fact]
+    public async Task PackageName_SiblingPackagesOfEqualLength_ResolveByName()
+    {
+        WriteFile("delta/__init__.py", "def delta_function() -> None:\n    pass\n");
+        WriteFile("bravo/__init__.py", "def bravo_function() -> None:\n    pass\n");
+
+        var api = await GraphAsync();
+
+        Assert.Equal("bravo", api.Package);
+    }
+
+    /// <summary>
+    /// Widget is referenced from two modules, once by its imported name and
+    /// once qualified; both resolve to the same installed class.
+    /// </summary>
+    [Fact]
+    public async Task Dependencies_ListSharedClassOnce()
+    {
+        WriteFile("pkg/__init__.py", "");
+        WriteFile("pkg/alpha.py", "from ext import Widget\n\n\ndef make_widget() -> Widget:\n    pass\n");
+        WriteFile("pkg/beta.py", "import ext\n\n\ndef use_widget(widget: ext.Widget) -> None:\n    pass\n");
+        WriteFile("venv/lib/python3.12/site-packages/ext/__init__.py",
+            "class Widget:\n    def spin(self) -> int:\n        pass\n");
+
+        var api = await GraphAsync();
+
+        Assert.NotNull(api.Dependencies);
+        var ext = Assert.Single(api.Dependencies, d => d.Package == "ext");
+        Assert.Single(ext.Classes ?? [], c => c.Name == "Widget");
+    }
+
+    /// <summary>
+    /// Packages with 64 or more files are extracted in a process pool.
+    /// Each half on its own stays below that threshold and is extracted
+    /// serially, so the pooled result must match the two halves combined.
+    /// </summary>
+    [Fact]
+    public async Task ParallelExtraction_MatchesSerialExtraction()
+    {
+        const int moduleCount = 64;
+        for (var i = 0; i < moduleCount; i++)
+        {
+            var content = $$""""
+                from ext_lib_{{i % 4}} import Resource{{i}}
+
+
+                class Widget{{i}}:
+                    """Widget number {{i}}."""
+
+                    def get(self, name: str) -> Resource{{i}}:
+                        """Get a resource."""
+
+
+                def make_widget_{{i}}(size: int = {{i}}) -> Widget{{i}}:
+                    """Make a widget."""
+                """";
+            var relativePath = Path.Combine("widgets", $"module_{i:D2}.py");
+            WriteFile(Path.Combine("pooled", relativePath), content);
+            WriteFile(Path.Combine(i < moduleCount / 2 ? "serial_a" : "serial_b", relativePath), content);
+        }
+
+        var pooled = await GraphAsync("pooled");
+        var serialA = await GraphAsync("serial_a");
+        var serialB = await GraphAsync("serial_b");
+
+        Assert.Equal(moduleCount, pooled.Modules.Count);
+        Assert.Equal(
+            new ApiIndex("widgets", [.. serialA.Modules, .. serialB.Modules]).ToJson(),
+            new ApiIndex("widgets", pooled.Modules).ToJson());
+
+        var serialPackages = (serialA.Dependencies ?? []).Concat(serialB.Dependencies ?? [])
+            .Select(d => d.Package).Distinct().Order();
+        Assert.Equal(serialPackages, (pooled.Dependencies ?? []).Select(d => d.Package).Order());
+    }
+}